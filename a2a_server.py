@@ -5,7 +5,9 @@ Exposes your MCP tools over the A2A protocol using FastAPI's modern lifespan API
 Uses A2A_EXPOSED_TOOLS env var to control which tool categories are exposed.
 """
 
+import asyncio
 import os
+from typing import List, Union
 from urllib.parse import urljoin
 from pathlib import Path
 from dotenv import load_dotenv
@@ -302,9 +304,18 @@ Use the 'a2a.discover' method to get full tool descriptions and schemas."""
 # A2A RPC Handler
 # -----------------------------
 @app.post("/a2a")
-async def a2a_handler(req: RPCRequest, request: Request):
+async def a2a_handler(req: Union[List[RPCRequest], RPCRequest], request: Request):
     client = request.app.state.client
 
+    # JSON-RPC 2.0 batch: an array of requests gets an array of responses
+    if isinstance(req, list):
+        return await asyncio.gather(*(handle_rpc(r, client) for r in req))
+
+    return await handle_rpc(req, client)
+
+
+async def handle_rpc(req: RPCRequest, client) -> dict:
+    """Dispatch a single JSON-RPC request to the MCP sessions"""
     if req.method == "a2a.discover":
         # Collect tools from all sessions
         all_tools = []
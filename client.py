@@ -20,6 +20,7 @@ from client.distributed_skills_manager import (
 
 # Import client modules
 from client import logging_handler, langgraph, models, websocket, cli, utils
+from client.commands import ToolsIndex
 
 from client.a2a_client import A2AClient
 from client.a2a_mcp_bridge import make_a2a_tool
@@ -58,6 +59,9 @@ A2A_STATE = {
     "endpoints": []  # Track successfully registered endpoints
 }
 
+# Clients behind registered A2A tools - their connection pools are closed at shutdown
+A2A_CLIENTS = []
+
 # Default system prompt - will be overridden if tool_usage_guide.md exists
 SYSTEM_PROMPT = """# SYSTEM INSTRUCTION: YOU ARE A TOOL-USING AGENT
 
@@ -127,12 +131,13 @@ async def register_a2a_tools(mcp_agent, base_url: str, logger) -> bool:
     Returns:
         bool: True if tools were successfully registered, False otherwise
     """
+    a2a = A2AClient(base_url)
     try:
-        a2a = A2AClient(base_url)
         capabilities = await a2a.discover()
 
     except Exception as e:
         logger.error(f"⚠️ A2A connection failed: {e}")
+        await a2a.aclose()
         return False  # Return failure status
 
     # If discovery succeeded, register tools
@@ -142,6 +147,11 @@ async def register_a2a_tools(mcp_agent, base_url: str, logger) -> bool:
         mcp_agent._tools.append(tool)
         tool_count += 1
 
+    if tool_count:
+        A2A_CLIENTS.append(a2a)
+    else:
+        await a2a.aclose()
+
     return tool_count > 0  # Return success if at least one tool was registered
 
 async def register_all_a2a_endpoints(mcp_agent, logger):
@@ -205,15 +215,12 @@ async def register_all_a2a_endpoints(mcp_agent, logger):
     logger.info(f"   New A2A tools added: {total_new_tools}")
     logger.info(f"   Total tools now available: {final_tool_count}")
 
+    # One record per list rather than one per endpoint
     if successful:
-        logger.info(f"   Active A2A endpoints:")
-        for endpoint in successful:
-            logger.info(f"      ✓ {endpoint}")
+        logger.info("   Active A2A endpoints:\n%s", "\n".join(f"      ✓ {endpoint}" for endpoint in successful))
 
     if failed:
-        logger.info(f"   Failed endpoints:")
-        for endpoint in failed:
-            logger.info(f"      ✗ {endpoint}")
+        logger.info("   Failed endpoints:\n%s", "\n".join(f"      ✗ {endpoint}" for endpoint in failed))
 
     logger.info("=" * 60)
 
@@ -602,6 +609,9 @@ async def main():
     # Create LangGraph agent
     agent = langgraph.create_langgraph_agent(llm_with_tools, tools)
 
+    # Tool set is final from here on - index it once for the CLI/WebSocket commands
+    tools_index = ToolsIndex(tools)
+
     # Create multi-agent orchestrator if available
     orchestrator = None
     if MULTI_AGENT_AVAILABLE:
@@ -746,7 +756,8 @@ async def main():
         mcp_agent=mcp_agent,
         session_manager=session_manager,
         host="0.0.0.0",
-        port=8765
+        port=8765,
+        tools_index=tools_index
     )
 
     log_websocket_server = await websocket.start_log_websocket_server(
@@ -799,7 +810,8 @@ async def main():
             orchestrator,
             MULTI_AGENT_STATE,
             A2A_STATE,
-            mcp_agent
+            mcp_agent,
+            tools_index=tools_index
         )
     except KeyboardInterrupt:
         print("\n👋 Shutting down...")
@@ -808,6 +820,7 @@ async def main():
         await websocket_server.wait_closed()
         log_websocket_server.close()
         await log_websocket_server.wait_closed()
+        await asyncio.gather(*(a2a.aclose() for a2a in A2A_CLIENTS), return_exceptions=True)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,51 @@
 # client/a2a_client.py
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 import httpx
 from urllib.parse import urljoin
 
+# orjson is a C parser/serializer - fall back to stdlib json if it isn't installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 class A2AClient:
     def __init__(self, base_url: str, timeout: float = 60.0):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.rpc_url = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Shared connection pool for all requests to this agent.
+        Uses HTTP/2 so concurrent calls multiplex over one connection;
+        falls back to HTTP/1.1 keep-alive if h2 is not installed.
+        """
+        if self._client is None:
+            limits = httpx.Limits(max_keepalive_connections=10)
+            try:
+                self._client = httpx.AsyncClient(http2=True, timeout=self.timeout, limits=limits)
+            except ImportError:
+                self._client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _rpc(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if not self.rpc_url:
@@ -22,10 +58,10 @@ class A2AClient:
             "params": params,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(self.rpc_url, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
+        client = self._get_client()
+        resp = await client.post(self.rpc_url, content=_json_dumps(payload), headers=_JSON_HEADERS)
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
 
         if "error" in data:
             raise RuntimeError(f"A2A error: {data['error']}")
@@ -35,10 +71,10 @@ class A2AClient:
         # 1. Fetch the agent card from the well-known location
         agent_card_url = f"{self.base_url}/.well-known/agent-card.json"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(agent_card_url)
-            resp.raise_for_status()
-            card = resp.json()
+        client = self._get_client()
+        resp = await client.get(agent_card_url)
+        resp.raise_for_status()
+        card = _json_loads(resp.content)
 
         # 2. Extract the RPC endpoint from the card
         endpoints = card.get("endpoints", {})
@@ -50,12 +86,78 @@ class A2AClient:
         # 3. Handle relative URLs by joining with base_url
         self.rpc_url = urljoin(self.base_url + "/", rpc_url)
 
-        # 4. Now discover available tools via RPC
+        # 4. Cards that embed the full tool list save the discovery round-trip
+        #    (capabilities.tools is just a feature flag, not a tool list)
+        tools = card.get("tools")
+        if isinstance(tools, list):
+            return {"tools": tools}
+
+        # 5. Otherwise discover available tools via RPC
         result = await self._rpc("a2a.discover", {})
         return result
 
+    async def _rpc_batch(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several JSON-RPC requests in one POST (JSON-RPC 2.0 batch).
+        Returns the raw response objects in the same order as the requests.
+        """
+        if not self.rpc_url:
+            raise RuntimeError("Must call discover() before making RPC calls")
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": str(uuid.uuid4()),
+                "method": method,
+                "params": params,
+            }
+            for method, params in requests
+        ]
+
+        client = self._get_client()
+        resp = await client.post(self.rpc_url, content=_json_dumps(payload), headers=_JSON_HEADERS)
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+
+        if not isinstance(data, list):
+            raise RuntimeError(f"A2A error: expected batch response, got {data}")
+
+        # Servers may answer a batch in any order - match responses back by id
+        by_id = {item.get("id"): item for item in data}
+        return [
+            by_id.get(item["id"], {"error": f"No response for request {item['id']}"})
+            for item in payload
+        ]
+
     async def call(self, tool: str, arguments: Dict[str, Any]) -> Any:
         return await self._rpc("a2a.call", {
             "tool": tool,
             "arguments": arguments,
-        })
\ No newline at end of file
+        })
+
+    async def call_many(
+            self,
+            calls: List[Tuple[str, Dict[str, Any]]],
+            return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Call several remote tools with a single HTTP round-trip.
+        Results are returned in the same order as `calls`. With
+        return_exceptions=True, failed calls yield a RuntimeError in
+        place instead of raising (like asyncio.gather).
+        """
+        responses = await self._rpc_batch([
+            ("a2a.call", {"tool": tool, "arguments": arguments})
+            for tool, arguments in calls
+        ])
+
+        results = []
+        for data in responses:
+            if "error" in data:
+                error = RuntimeError(f"A2A error: {data['error']}")
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+            else:
+                results.append(data.get("result", {}))
+        return results
\ No newline at end of file
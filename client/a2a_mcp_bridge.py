@@ -1,82 +1,213 @@
-from typing import Any, Dict
+import asyncio
+import functools
+import hashlib
+import json
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, create_model
 from client.a2a_client import A2AClient
 
 
-def make_a2a_tool(a2a_client: A2AClient, tool_def: Dict[str, Any]):
+# Map JSON schema types to Python types
+_TYPE_MAP = {
+    'string': str,
+    'integer': int,
+    'number': float,
+    'boolean': bool,
+    'array': list,
+    'object': dict,
+}
+
+# Compiled input models keyed by a hash of the tool's input schema.
+# Tool definitions are static between discover calls, so reconnects
+# and repeated bridge construction can reuse the same Pydantic class.
+_SCHEMA_CACHE: Dict[str, type[BaseModel]] = {}
+
+# Shared input model for tools that take no parameters
+_EmptyInputModel = create_model('_EmptyInputModel')
+
+
+def _schema_key(input_schema: Dict[str, Any]) -> str:
+    """Stable hash of an A2A input schema"""
+    encoded = json.dumps(input_schema, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=512)
+def _make_field(required: bool, description: str):
     """
-    Create a LangChain-compatible StructuredTool that forwards calls to a remote A2A agent.
-    This version:
-      - Creates a proper Pydantic schema from the A2A tool definition
-      - Handles multiple named parameters correctly
-      - Avoids double-prefixing
-      - Handles async execution correctly
+    Shared Field for a (required, description) pair. Pydantic copies the
+    FieldInfo into each model, so one instance can back many fields.
     """
+    if required:
+        return Field(description=description)
+    return Field(default=None, description=description)
 
-    # Use the remote tool name directly (no double prefixing)
-    remote_name = tool_def["name"]
-    local_name = f"a2a_{remote_name}"
 
-    description = tool_def.get(
-        "description",
-        f"Remote A2A tool: {remote_name}"
-    )
+def _build_input_model(local_name: str, input_schema: Dict[str, Any]) -> type[BaseModel]:
+    """Get (or compile and cache) the Pydantic input model for a schema"""
+    cache_key = _schema_key(input_schema)
+    InputModel = _SCHEMA_CACHE.get(cache_key)
+    if InputModel is not None:
+        return InputModel
 
-    # Extract input schema from the tool definition
-    input_schema = tool_def.get('inputSchema', {})
     properties = input_schema.get('properties', {})
     required = input_schema.get('required', [])
 
     # Build Pydantic field definitions
     field_definitions = {}
     for prop_name, prop_schema in properties.items():
-        field_type = Any  # Default type
         field_description = prop_schema.get('description', '')
-
-        # Map JSON schema types to Python types
-        prop_type = prop_schema.get('type', 'string')
-        if prop_type == 'string':
-            field_type = str
-        elif prop_type == 'integer':
-            field_type = int
-        elif prop_type == 'number':
-            field_type = float
-        elif prop_type == 'boolean':
-            field_type = bool
-        elif prop_type == 'array':
-            field_type = list
-        elif prop_type == 'object':
-            field_type = dict
+        field_type = _TYPE_MAP.get(prop_schema.get('type', 'string'), Any)
 
         # Make optional if not required
-        if prop_name not in required:
-            # Use Optional syntax for Python 3.9 compatibility
-            from typing import Optional
-            field_definitions[prop_name] = (Optional[field_type], Field(default=None, description=field_description))
-        else:
-            field_definitions[prop_name] = (field_type, Field(description=field_description))
+        is_required = prop_name in required
+        if not is_required:
+            # Use Optional syntax for Python 3.9 compatibility (typing caches Optional[...] itself)
+            field_type = Optional[field_type]
+        field_definitions[prop_name] = (field_type, _make_field(is_required, field_description))
 
     # Create a dynamic Pydantic model for the input schema
-    # If no properties, create a simple model with no fields
+    # If no properties, reuse the shared empty model
     if field_definitions:
         InputModel = create_model(
             f"{local_name}_input",
             **field_definitions
         )
     else:
-        # Empty schema - create a base model with no fields
-        class InputModel(BaseModel):
-            pass
+        InputModel = _EmptyInputModel
+
+    _SCHEMA_CACHE[cache_key] = InputModel
+    return InputModel
+
+
+# How long to wait for more calls before sending a batch (seconds)
+_BATCH_WINDOW = 0.005
+
+
+class _A2ACallBatcher:
+    """
+    Coalesces A2A tool calls made within the same short window into a single
+    JSON-RPC batch request, so parallel tool calls cost one HTTP round-trip.
+    """
+
+    def __init__(self, window: float = _BATCH_WINDOW):
+        self.window = window
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def call(self, a2a_client: A2AClient, tool: str, arguments: Dict[str, Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((tool, arguments, future))
+
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush(a2a_client))
+            self._flush_task.add_done_callback(self._on_flush_done)
+
+        return await future
+
+    def _on_flush_done(self, task: asyncio.Task):
+        # Still the current flush task: it was cancelled (possibly before it ever
+        # ran) while its calls sat in the window, so nothing will send them
+        if task is self._flush_task:
+            self._fail_unresolved(self._take_pending())
+
+    @staticmethod
+    def _fail_unresolved(pending: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        # Fail the callers rather than leave their _run coroutines waiting forever
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("A2A call batch was aborted before it completed"))
+
+    def _take_pending(self) -> List[Tuple[str, Dict[str, Any], asyncio.Future]]:
+        pending, self._pending = self._pending, []
+        self._flush_task = None
+        return pending
+
+    async def _flush(self, a2a_client: A2AClient):
+        pending = None
+        try:
+            await asyncio.sleep(self.window)
+            pending = self._take_pending()
+
+            calls = [(tool, arguments) for tool, arguments, _ in pending]
+
+            if len(calls) == 1:
+                outcomes = await asyncio.gather(a2a_client.call(*calls[0]), return_exceptions=True)
+            else:
+                try:
+                    outcomes = await a2a_client.call_many(calls, return_exceptions=True)
+                except Exception:
+                    # Remote agent may not support batches - fall back to one request per call
+                    outcomes = await asyncio.gather(
+                        *(a2a_client.call(tool, arguments) for tool, arguments in calls),
+                        return_exceptions=True
+                    )
+
+            for (_, _, future), outcome in zip(pending, outcomes):
+                if future.done():
+                    continue  # Caller was cancelled
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+        finally:
+            # Cancelled or failed mid-batch; calls still in the window are
+            # handled by _on_flush_done
+            if pending is not None:
+                self._fail_unresolved(pending)
+
+
+# One batcher per A2A client, dropped when the client goes away
+_BATCHERS: "weakref.WeakKeyDictionary[A2AClient, _A2ACallBatcher]" = weakref.WeakKeyDictionary()
+
+
+def _get_batcher(a2a_client: A2AClient) -> _A2ACallBatcher:
+    batcher = _BATCHERS.get(a2a_client)
+    if batcher is None:
+        batcher = _A2ACallBatcher()
+        _BATCHERS[a2a_client] = batcher
+    return batcher
+
+
+def make_a2a_tool(a2a_client: A2AClient, tool_def: Dict[str, Any]):
+    """
+    Create a LangChain-compatible StructuredTool that forwards calls to a remote A2A agent.
+    This version:
+      - Creates a proper Pydantic schema from the A2A tool definition
+      - Handles multiple named parameters correctly
+      - Avoids double-prefixing
+      - Handles async execution correctly
+      - Reuses compiled input models for identical schemas
+      - Batches concurrent calls to the same agent into one request
+    """
+
+    # Use the remote tool name directly (no double prefixing)
+    remote_name = tool_def["name"]
+    local_name = f"a2a_{remote_name}"
+
+    description = tool_def.get(
+        "description",
+        f"Remote A2A tool: {remote_name}"
+    )
+
+    # Extract input schema from the tool definition
+    input_schema = tool_def.get('inputSchema', {})
+
+    # StructuredTool validates arguments against this model before _run is
+    # called, so bad calls come back to the LLM as tool errors
+    InputModel = _build_input_model(local_name, input_schema)
 
     # Create the tool function that calls A2A
     async def _run(**kwargs) -> Any:
         """
         Execute the A2A tool with the provided arguments.
-        LangChain will pass named parameters based on the Pydantic schema.
+        LangChain will pass named parameters based on the input schema.
         """
-        # Forward the call to the remote A2A agent
-        return await a2a_client.call(remote_name, kwargs)
+        # Forward the call to the remote A2A agent (batched with concurrent calls)
+        return await _get_batcher(a2a_client).call(a2a_client, remote_name, kwargs)
 
     # Wrap in a LangChain StructuredTool
     return StructuredTool(
@@ -3,15 +3,25 @@ A2A Agent System
 
 Agent-to-Agent communication framework for MCP
 Allows agents to coordinate via message passing
+
+Agent classes are imported lazily on first access, so importing one
+agent module doesn't load every other agent.
 """
 
-from .base_agent import BaseAgent, AgentMessage, MessageType
-from .orchestrator import OrchestratorAgent
-from .researcher import ResearcherAgent
-from .plex_ingester import PlexIngesterAgent
-from .analyst import AnalystAgent
-from .planner import PlannerAgent
-from .writer import WriterAgent
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'BaseAgent': 'base_agent',
+    'AgentMessage': 'base_agent',
+    'MessageType': 'base_agent',
+    'OrchestratorAgent': 'orchestrator',
+    'ResearcherAgent': 'researcher',
+    'PlexIngesterAgent': 'plex_ingester',
+    'AnalystAgent': 'analyst',
+    'PlannerAgent': 'planner',
+    'WriterAgent': 'writer',
+}
 
 __all__ = [
     'BaseAgent',
@@ -23,4 +33,18 @@ __all__ = [
     'AnalystAgent',
     'PlannerAgent',
     'WriterAgent'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -6,7 +6,8 @@ Handles LLM invocation, tool calling, and inter-agent messaging
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any, Callable
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
@@ -20,9 +21,9 @@ class MessageType(Enum):
     NOTIFICATION = "notification"  # Status update
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentMessage:
-    """Message passed between agents"""
+    """Message passed between agents (immutable; metadata dict is shallow-frozen only)"""
     from_agent: str
     to_agent: Optional[str]  # None = broadcast
     message_type: MessageType
@@ -31,12 +32,45 @@ class AgentMessage:
     timestamp: Optional[float] = None
 
 
+# Prompt text -> SystemMessage; agents of the same role share one instance
+_SYSTEM_MESSAGE_CACHE: Dict[str, SystemMessage] = {}
+
+# Tool result cache shared by every agent: (tool_name, args) -> (timestamp, result),
+# LRU ordered. Shared so a write through one agent invalidates all agents' reads.
+_TOOL_RESULT_CACHE: OrderedDict = OrderedDict()
+
+
 class BaseAgent:
     """
     Base class for all specialized agents
     Provides LLM access, tool calling, and A2A messaging
     """
 
+    # Read-only tools whose results may be reused for a few seconds (TTL in seconds).
+    # Only writes made through BaseAgent.call_tool invalidate the cache; a write made
+    # elsewhere (main LangGraph agent, Web UI, another process) can leave a cached
+    # result stale for up to its TTL.
+    TOOL_CACHE_TTL: Dict[str, float] = {
+        'rag_search_tool': 60,
+        'plex_get_stats': 30,
+        'get_weather_tool': 300,
+    }
+    # MCP server tools that change state - calling one invalidates cached results
+    MUTATING_TOOLS = frozenset((
+        # rag server
+        'rag_add_tool', 'rag_rescan_no_subtitles',
+        # plex server
+        'plex_ingest_batch', 'plex_ingest_items', 'plex_ingest_single',
+        'import_plex_history', 'record_viewing', 'train_recommender',
+        'reset_recommender', 'auto_train_from_plex',
+        # todo server
+        'add_todo_item', 'update_todo_item', 'delete_todo_item', 'delete_all_todo_items',
+        # knowledge base server
+        'add_entry', 'update_entry', 'update_entry_versioned', 'delete_entry', 'delete_entries',
+    ))
+    TOOL_CACHE_MAXSIZE = 128
+    MESSAGE_HISTORY_MAXLEN = 1024
+
     def __init__(
             self,
             agent_id: str,
@@ -51,15 +85,27 @@ class BaseAgent:
         self.role = role
         self.llm = llm
         self.tools = {tool.name: tool for tool in tools} if tools else {}
+        self._tool_names = tuple(self.tools)  # Tool set is fixed after construction
         self.system_prompt = system_prompt
+        self._system_message = self._get_system_message(system_prompt)
         self.logger = logger
         self.message_bus = message_bus  # Callback to send messages to other agents
 
         # State management
         self.context: Dict[str, Any] = {}
-        self.message_history: List[AgentMessage] = []
+        # Bounded so long-running agents don't grow without limit
+        self.message_history: Deque[AgentMessage] = deque(maxlen=self.MESSAGE_HISTORY_MAXLEN)
+        self.messages_sent = 0
         self.is_busy = False
 
+    @classmethod
+    def _get_system_message(cls, system_prompt: str) -> SystemMessage:
+        """Share one SystemMessage across all agents built with the same prompt"""
+        message = _SYSTEM_MESSAGE_CACHE.get(system_prompt)
+        if message is None:
+            message = _SYSTEM_MESSAGE_CACHE[system_prompt] = SystemMessage(content=system_prompt)
+        return message
+
     async def process_message(self, message: AgentMessage) -> Optional[AgentMessage]:
         """
         Process incoming message - override in subclasses
@@ -73,7 +119,7 @@ class BaseAgent:
         This is the main execution method
         """
         self.is_busy = True
-        self.logger.info(f"🤖 [{self.agent_id}] Executing: {task_description[:50]}...")
+        self.logger.info("🤖 [%s] Executing: %.50s...", self.agent_id, task_description)
 
         try:
             # Build context
@@ -81,7 +127,7 @@ class BaseAgent:
 
             # Create messages
             messages = [
-                SystemMessage(content=self.system_prompt),
+                self._system_message,
                 HumanMessage(content=f"{task_description}\n\n{context_str}")
             ]
 
@@ -89,7 +135,7 @@ class BaseAgent:
             response = await self.llm.ainvoke(messages)
             result = response.content if hasattr(response, 'content') else str(response)
 
-            self.logger.info(f"✅ [{self.agent_id}] Task completed")
+            self.logger.info("✅ [%s] Task completed", self.agent_id)
             return result
 
         except Exception as e:
@@ -103,11 +149,38 @@ class BaseAgent:
         if tool_name not in self.tools:
             raise ValueError(f"Tool {tool_name} not available to {self.agent_id}")
 
+        # Serve repeated read-only calls from cache
+        ttl = self.TOOL_CACHE_TTL.get(tool_name)
+        key = None
+        if ttl:
+            try:
+                key = (tool_name, tuple(sorted(kwargs.items())))
+                hash(key)
+            except TypeError:
+                key = None  # Unhashable arguments - don't cache
+
+        if key is not None:
+            cached = _TOOL_RESULT_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                _TOOL_RESULT_CACHE.move_to_end(key)
+                self.logger.info("♻️ [%s] Cached tool result: %s", self.agent_id, tool_name)
+                return cached[1]
+
         tool = self.tools[tool_name]
-        self.logger.info(f"🔧 [{self.agent_id}] Calling tool: {tool_name}")
+        self.logger.info("🔧 [%s] Calling tool: %s", self.agent_id, tool_name)
 
         # Tools are async-compatible via ainvoke
         result = await tool.ainvoke(kwargs)
+
+        if key is not None:
+            _TOOL_RESULT_CACHE[key] = (time.monotonic(), result)
+            _TOOL_RESULT_CACHE.move_to_end(key)
+            if len(_TOOL_RESULT_CACHE) > self.TOOL_CACHE_MAXSIZE:
+                _TOOL_RESULT_CACHE.popitem(last=False)
+        elif tool_name in self.MUTATING_TOOLS:
+            # State changed - every agent's cached stats/search results may be stale
+            _TOOL_RESULT_CACHE.clear()
+
         return result
 
     async def send_message(
@@ -132,6 +205,7 @@ class BaseAgent:
         )
 
         self.message_history.append(message)
+        self.messages_sent += 1
         await self.message_bus(message)
 
     def _build_context_string(self, context: Dict) -> str:
@@ -139,11 +213,7 @@ class BaseAgent:
         if not context:
             return ""
 
-        parts = []
-        for key, value in context.items():
-            parts.append(f"{key}: {value}")
-
-        return "Context:\n" + "\n".join(parts)
+        return "Context:\n" + "\n".join(f"{key}: {value}" for key, value in context.items())
 
     def get_status(self) -> Dict[str, Any]:
         """Get agent status"""
@@ -151,6 +221,6 @@ class BaseAgent:
             "agent_id": self.agent_id,
             "role": self.role,
             "is_busy": self.is_busy,
-            "tools": list(self.tools.keys()),
-            "messages_sent": len(self.message_history)
+            "tools": self._tool_names,
+            "messages_sent": self.messages_sent
         }
\ No newline at end of file
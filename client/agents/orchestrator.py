@@ -2,10 +2,22 @@
 Orchestrator Agent - Plans and coordinates multi-agent workflows
 """
 
+import asyncio
 import json
-from typing import Dict, List, Any, Optional
+import re
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Callable, Awaitable
 from .base_agent import BaseAgent, AgentMessage, MessageType
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Extracts the body of a ```json ... ``` fenced block in a single pass
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
 
 class OrchestratorAgent(BaseAgent):
     """
@@ -90,24 +102,87 @@ User: "What's the weather?"
 
     async def create_plan(self, user_request: str) -> Dict[str, Any]:
         """Create execution plan from user request"""
-        self.logger.info(f"📋 [{self.agent_id}] Creating plan for: {user_request[:50]}...")
+        self.logger.info("📋 [%s] Creating plan for: %.50s...", self.agent_id, user_request)
 
         result = await self.execute_task(f"Create execution plan for: {user_request}")
 
         # Parse JSON response
         try:
-            # Clean response
-            result_clean = result.strip()
-            if result_clean.startswith("```json"):
-                result_clean = result_clean[7:]
-            if result_clean.startswith("```"):
-                result_clean = result_clean[3:]
-            if result_clean.endswith("```"):
-                result_clean = result_clean[:-3]
-
-            plan = json.loads(result_clean.strip())
-            self.logger.info(f"✅ Plan created with {len(plan.get('subtasks', []))} subtasks")
+            # Strip markdown code fence if present
+            match = _FENCE_RE.match(result)
+            payload = match.group(1) if match else result.strip()
+
+            plan = _json_loads(payload)
+            self.logger.info("✅ Plan created with %d subtasks", len(plan.get('subtasks', [])))
             return plan
         except json.JSONDecodeError as e:
             self.logger.warning(f"⚠️ Failed to parse plan: {e}. Using fallback.")
-            return {"subtasks": []}
\ No newline at end of file
+            return {"subtasks": []}
+
+    async def execute_plan(
+            self,
+            plan: Dict[str, Any],
+            dispatch: Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[Any]],
+            max_parallel: int = 4,
+            should_stop: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute plan subtasks level by level, respecting depends_on.
+        Subtasks in the same level run concurrently (bounded by max_parallel)
+        via dispatch(subtask, results_so_far). Returns {task_id: result}.
+        """
+        levels = self._plan_levels(plan.get("subtasks", []))
+        semaphore = asyncio.Semaphore(max_parallel)
+        results: Dict[str, Any] = {}
+
+        async def run(subtask: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await dispatch(subtask, results)
+
+        for level in levels:
+            if should_stop and should_stop():
+                self.logger.warning("🛑 [%s] Plan stopped after %d subtasks", self.agent_id, len(results))
+                break
+
+            self.logger.info("⚙️ [%s] Running %d subtask(s) in parallel", self.agent_id, len(level))
+            level_results = await asyncio.gather(*(run(st) for st in level), return_exceptions=True)
+
+            for subtask, result in zip(level, level_results):
+                if isinstance(result, Exception):
+                    result = f"Error: {str(result)}"
+                results[subtask["id"]] = result
+
+        return results
+
+    def _plan_levels(self, subtasks: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group subtasks into dependency levels (Kahn's topological sort)"""
+        index_by_id = {subtask["id"]: i for i, subtask in enumerate(subtasks)}
+        indegree = [0] * len(subtasks)
+        dependents = defaultdict(list)
+
+        for i, subtask in enumerate(subtasks):
+            for dep_id in subtask.get("depends_on", []):
+                dep = index_by_id.get(dep_id)
+                if dep is not None and dep != i:
+                    indegree[i] += 1
+                    dependents[dep].append(i)
+
+        levels = []
+        current = [i for i, degree in enumerate(indegree) if degree == 0]
+        while current:
+            levels.append([subtasks[i] for i in current])
+            following = []
+            for i in current:
+                for child in dependents[i]:
+                    indegree[child] -= 1
+                    if indegree[child] == 0:
+                        following.append(child)
+            current = sorted(following)
+
+        # Dependency cycle - run what's left sequentially in plan order
+        leftover = [i for i, degree in enumerate(indegree) if degree > 0]
+        if leftover:
+            self.logger.warning("⚠️ [%s] Dependency cycle in plan, running remaining subtasks in order", self.agent_id)
+            levels.extend([subtasks[i]] for i in leftover)
+
+        return levels
\ No newline at end of file
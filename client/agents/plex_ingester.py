@@ -47,7 +47,7 @@ CRITICAL: Never make up item IDs! Only use IDs provided to you."""
 
             if item_id:
                 # Single item ingestion
-                self.logger.info(f"📥 [{self.agent_id}] Ingesting: {item_name}")
+                self.logger.info("📥 [%s] Ingesting: %s", self.agent_id, item_name)
 
                 try:
                     result = await self.call_tool("plex_ingest_single", item_id=item_id)
@@ -93,7 +93,7 @@ CRITICAL: Never make up item IDs! Only use IDs provided to you."""
 
     async def ingest_item(self, item_id: str, item_name: str = None) -> Dict[str, Any]:
         """Direct method to ingest a single item"""
-        self.logger.info(f"📥 [{self.agent_id}] Ingesting item: {item_id}")
+        self.logger.info("📥 [%s] Ingesting item: %s", self.agent_id, item_id)
 
         try:
             result = await self.call_tool("plex_ingest_single", item_id=item_id)
@@ -2,17 +2,20 @@
 Writer Agent - Creates summaries and reports
 """
 
-from typing import Optional
+from types import MappingProxyType
+from typing import ClassVar, Optional
 from .base_agent import BaseAgent, AgentMessage, MessageType
 
+# Shared, read-only metadata for every writing response (nothing downstream mutates it)
+_WRITING_COMPLETED_METADATA = MappingProxyType({"writing_completed": True})
+
 
 class WriterAgent(BaseAgent):
     """
     Creates summaries, reports, and written content
     """
 
-    def __init__(self, agent_id: str, llm, tools, logger, message_bus):
-        system_prompt = """You are a Writer Agent focused on clear communication.
+    SYSTEM_PROMPT: ClassVar[str] = """You are a Writer Agent focused on clear communication.
 
 Your tools:
 - rag_search_tool: Gather information for writing
@@ -21,12 +24,13 @@ Your tools:
 Gather information using tools, then create well-structured summaries.
 Focus on clarity, completeness, and good organization."""
 
+    def __init__(self, agent_id: str, llm, tools, logger, message_bus):
         super().__init__(
             agent_id=agent_id,
             role="writer",
             llm=llm,
             tools=tools,
-            system_prompt=system_prompt,
+            system_prompt=self.SYSTEM_PROMPT,
             logger=logger,
             message_bus=message_bus
         )
@@ -44,6 +48,6 @@ Focus on clarity, completeness, and good organization."""
                 to_agent=message.from_agent,
                 message_type=MessageType.RESPONSE,
                 content=result,
-                metadata={"writing_completed": True}
+                metadata=_WRITING_COMPLETED_METADATA
             )
         return None
\ No newline at end of file
@@ -4,49 +4,106 @@ Handles command-line interface and user input
 """
 
 import asyncio
-import threading
 import sys
 
-from prompt_toolkit import prompt
-from queue import Queue
-from client.websocket import broadcast_message
-from client.commands import handle_command, get_commands_list, handle_a2a_commands, handle_multi_agent_commands
-from client.stop_signal import request_stop
+from client.websocket import broadcast_message, broadcast_text, fire_broadcast
+from client.commands import (
+    handle_command, get_commands_text, handle_a2a_commands, handle_multi_agent_commands, NO_ARG_COMMANDS
+)
+from client.stop_signal import request_stop, is_stop_requested
 
 
 def list_commands():
     """Print available CLI commands"""
-    for line in get_commands_list():
-        print(line)
+    print(get_commands_text())
 
 
-def input_thread(input_queue, stop_event):
-    """Thread to handle blocking input() calls"""
-    while not stop_event.is_set():
-        try:
-            query = prompt("> ")
-            input_queue.put(query)
-        except (EOFError, KeyboardInterrupt):
-            break
+async def read_line(session):
+    """Prompt for one line; Ctrl-C comes back as None instead of escaping the task"""
+    try:
+        return await session.prompt_async("> ")
+    except KeyboardInterrupt:
+        return None
+
 
 async def cli_input_loop(agent, logger, tools, model_name, conversation_state, run_agent_fn, models_module,
                          system_prompt, create_agent_fn, orchestrator=None, multi_agent_state=None, a2a_state=None,
-                         mcp_agent=None):
-    """Handle CLI input using a separate thread (with multi-agent + A2A support + REAL-TIME STOP)"""
-    input_queue = Queue()
-    stop_event = threading.Event()
-
-    thread = threading.Thread(target=input_thread, args=(input_queue, stop_event), daemon=True)
-    thread.start()
+                         mcp_agent=None, tools_index=None):
+    """Handle CLI input with prompt_toolkit's async prompt (with multi-agent + A2A support + REAL-TIME STOP)"""
+    # Imported here so WebSocket-only launches never pay for prompt_toolkit
+    from prompt_toolkit import PromptSession
+    session = PromptSession()
 
     # Track current running agent task
     current_agent_task = None
+    prompt_task = None
+    input_closed = False
 
     try:
         while True:
-            await asyncio.sleep(0.01)  # Fast polling
+            # Sleep until input arrives or the running agent task finishes - no polling.
+            # The prompt stays live while the agent runs so :stop is accepted mid-run.
+            if prompt_task is None and not input_closed:
+                prompt_task = asyncio.create_task(read_line(session))
+            waiters = {prompt_task} if prompt_task else set()
+            if current_agent_task and not current_agent_task.done():
+                waiters.add(current_agent_task)
+            if not waiters:
+                # stdin is gone and nothing is running - idle while the Web UI keeps serving
+                await asyncio.get_running_loop().create_future()
+            done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+
+            if prompt_task not in done:
+                # Agent finished while the user was idle
+                current_agent_task = None
+                continue
+
+            try:
+                query = prompt_task.result()
+            except EOFError:
+                # stdin closed - stop prompting, as the old input thread did
+                input_closed = True
+                continue
+            finally:
+                prompt_task = None
+
+            if query is None:
+                # Ctrl-C: cancel a running agent the way :stop does, otherwise just
+                # drop the line - like the old input thread, it never ends the loop
+                if current_agent_task is None or current_agent_task.done():
+                    continue
+                query = ":stop"
+            query = query.strip()
+
+            # ═══════════════════════════════════════════════════════════
+            # PRIORITY: Handle :stop IMMEDIATELY - even during execution
+            # ═══════════════════════════════════════════════════════════
+            if query == ":stop":
+                agent_running = current_agent_task is not None and not current_agent_task.done()
+                if not agent_running and is_stop_requested():
+                    # Repeated :stop with nothing left to cancel - request_stop() just
+                    # logs how long ago the first one was; skip the banner and broadcast
+                    request_stop()
+                    continue
+
+                # Flag first so tools/sub-operations that own external resources
+                # wind down cleanly, then cancel the agent at its next await
+                request_stop()
+                if agent_running:
+                    current_agent_task.cancel()
+                print("\n🛑 Stop requested - operation will halt at next checkpoint")
+                print("   This may take a few seconds for the current step to complete.")
+                print("   Watch for '🛑 Stopped' messages below.\n")
+                sys.stdout.flush()
+                fire_broadcast("assistant_message", "🛑 Stop requested")
+
+                # Don't wait for the cancelled task - run_and_display reports it
+                continue
+
+            if not query:
+                continue
 
-            # Check if model changed (from Web UI switch)
+            # Check if model changed (from Web UI switch) before acting on new input
             current_last_model = models_module.load_last_model()
             if current_last_model and current_last_model != model_name:
                 logger.info(f"🔄 Detected model change: {model_name} → {current_last_model}")
@@ -58,110 +115,102 @@ async def cli_input_loop(agent, logger, tools, model_name, conversation_state, r
                     model_name = new_model
                     logger.info(f"✅ CLI synced to: {model_name}")
 
-            if not input_queue.empty():
-                query = input_queue.get().strip()
+            # Don't accept new queries while one is running
+            if current_agent_task and not current_agent_task.done():
+                print("⚠️  Please wait for current operation to complete or type :stop")
+                continue
+
+            # One slice compare decides command vs. plain query; plain
+            # queries then skip every prefix check below
+            is_command = query[:1] == ":"
+            # Exact no-arg commands skip head-token extraction entirely; the rest
+            # are routed on their first word, extracted once
+            head = query.split(None, 1)[0] if is_command and query not in NO_ARG_COMMANDS else ""
+
+            # Handle A2A commands first
+            if head == ":a2a":
+                handled, response, _, _ = await handle_a2a_commands(query, orchestrator)
+                if handled:
+                    print(response)
+                    fire_broadcast("assistant_message", response)
+                continue
+
+            # Handle multi-agent commands
+            if head == ":multi":
+                handled, response, _, _ = handle_multi_agent_commands(query, orchestrator, multi_agent_state)
+                if handled:
+                    print(response)
+                    fire_broadcast("assistant_message", response)
+                continue
+
+            # Handle other commands
+            if is_command:
+                handled, response, new_agent, new_model = await handle_command(
+                    query,
+                    tools,
+                    model_name,
+                    conversation_state,
+                    models_module,
+                    system_prompt,
+                    agent_ref=[agent],
+                    create_agent_fn=create_agent_fn,
+                    logger=logger,
+                    orchestrator=orchestrator,
+                    multi_agent_state=multi_agent_state,
+                    a2a_state=a2a_state,
+                    mcp_agent=mcp_agent,
+                    tools_index=tools_index
+                )
 
-                # ═══════════════════════════════════════════════════════════
-                # PRIORITY: Handle :stop IMMEDIATELY - even during execution
-                # ═══════════════════════════════════════════════════════════
-                if query == ":stop":
-                    request_stop()
-                    print("\n🛑 Stop requested - operation will halt at next checkpoint")
-                    print("   This may take a few seconds for the current step to complete.")
-                    print("   Watch for '🛑 Stopped' messages below.\n")
-                    sys.stdout.flush()
-                    await broadcast_message("assistant_message", {"text": "🛑 Stop requested"})
-
-                    # If there's a running task, don't wait for it - just continue
-                    # The stop signal will be picked up by the agent
+                if handled:
+                    if response:
+                        print(response)
+                        fire_broadcast("assistant_message", response)
+                    if new_agent:
+                        agent = new_agent
+                    if new_model:
+                        model_name = new_model
                     continue
 
-                if not query:
-                    continue
+            logger.info(f"💬 Received query: '{query}'")
 
-                # Don't accept new queries while one is running
-                if current_agent_task and not current_agent_task.done():
-                    print("⚠️  Please wait for current operation to complete or type :stop")
-                    continue
+            print(f"\n> {query}")
 
-                # Handle A2A commands first
-                if query.startswith(":a2a"):
-                    result = await handle_a2a_commands(query, orchestrator)
-                    if result:
-                        print(result)
-                        await broadcast_message("assistant_message", {"text": result})
-                    continue
+            fire_broadcast("user_message", query)
 
-                # Handle multi-agent commands
-                if query.startswith(":multi"):
-                    result = await handle_multi_agent_commands(query, orchestrator, multi_agent_state)
-                    if result:
-                        print(result)
-                        await broadcast_message("assistant_message", {"text": result})
-                    continue
+            # ═══════════════════════════════════════════════════════════
+            # RUN AGENT AS BACKGROUND TASK (non-blocking)
+            # This allows the CLI loop to continue and process :stop
+            # ═══════════════════════════════════════════════════════════
+            async def run_and_display():
+                try:
+                    result = await run_agent_fn(agent, conversation_state, query, logger, tools)
+
+                    final_message = result["messages"][-1]
+                    assistant_text = final_message.content
+
+                    print("\n" + assistant_text + "\n")
+                    logger.info("✅ Query completed successfully")
+
+                    await broadcast_message("assistant_message", {
+                        "text": assistant_text,
+                        "multi_agent": result.get("multi_agent", False),
+                        "a2a": result.get("a2a", False)
+                    })
+                except asyncio.CancelledError:
+                    print("\n🛑 Stopped\n")
+                    logger.info("🛑 Query cancelled by :stop")
+                    await broadcast_text("assistant_message", "🛑 Stopped")
+                except Exception as e:
+                    logger.error(f"❌ Error in agent execution: {e}")
+                    import traceback
+                    traceback.print_exc()
 
-                # Handle other commands
-                if query.startswith(":"):
-                    handled, response, new_agent, new_model = await handle_command(
-                        query,
-                        tools,
-                        model_name,
-                        conversation_state,
-                        models_module,
-                        system_prompt,
-                        agent_ref=[agent],
-                        create_agent_fn=create_agent_fn,
-                        logger=logger,
-                        orchestrator=orchestrator,
-                        multi_agent_state=multi_agent_state,
-                        a2a_state=a2a_state,
-                        mcp_agent=mcp_agent
-                    )
-
-                    if handled:
-                        if response:
-                            print(response)
-                            await broadcast_message("assistant_message", {"text": response})
-                        if new_agent:
-                            agent = new_agent
-                        if new_model:
-                            model_name = new_model
-                        continue
-
-                logger.info(f"💬 Received query: '{query}'")
-
-                print(f"\n> {query}")
-
-                await broadcast_message("user_message", {"text": query})
-
-                # ═══════════════════════════════════════════════════════════
-                # RUN AGENT AS BACKGROUND TASK (non-blocking)
-                # This allows the CLI loop to continue and process :stop
-                # ═══════════════════════════════════════════════════════════
-                async def run_and_display():
-                    try:
-                        result = await run_agent_fn(agent, conversation_state, query, logger, tools)
-
-                        final_message = result["messages"][-1]
-                        assistant_text = final_message.content
-
-                        print("\n" + assistant_text + "\n")
-                        logger.info("✅ Query completed successfully")
-
-                        await broadcast_message("assistant_message", {
-                            "text": assistant_text,
-                            "multi_agent": result.get("multi_agent", False),
-                            "a2a": result.get("a2a", False)
-                        })
-                    except Exception as e:
-                        logger.error(f"❌ Error in agent execution: {e}")
-                        import traceback
-                        traceback.print_exc()
-
-                # Start the task but DON'T await it - let it run in background
-                current_agent_task = asyncio.create_task(run_and_display())
+            # Start the task but DON'T await it - let it run in background
+            current_agent_task = asyncio.create_task(run_and_display())
 
     except KeyboardInterrupt:
         print("\n👋 Exiting.")
     finally:
-        stop_event.set()
\ No newline at end of file
+        if prompt_task is not None:
+            prompt_task.cancel()
\ No newline at end of file
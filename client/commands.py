@@ -3,68 +3,107 @@ Command Handlers for MCP Client
 Compatible with existing CLI/WebSocket interfaces
 UPDATED: :tools command now filters disabled tools
 """
+import re
+import time
+from collections import namedtuple
+from itertools import islice
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from client.env_display import format_env_display
 from client.langgraph import create_langgraph_agent
 from client.llm_backend import GGUFModelRegistry
+from client.models import invalidate_models_listing
+from client.stop_signal import request_stop
+
+try:
+    from client.metrics import prepare_metrics, format_metrics_summary
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+
+try:
+    from tools.tool_control import is_tool_enabled
+    TOOL_CONTROL_AVAILABLE = True
+except ImportError:
+    TOOL_CONTROL_AVAILABLE = False
+
+
+_COMMANDS = (
+    ":commands - List all available commands",
+    ":stop - Stop current operation (ingestion, search, etc.)",
+    ":stats - Show performance metrics",
+    ":tools - List available tools (disabled tools hidden)",
+    ":tools --all - List all tools (shows disabled tools marked)",
+    ":tool <tool> - Get the tool description",
+    ":model - List all available models (Ollama + GGUF)",
+    ":model <model> - Switch to model (auto-detects backend)",
+    ":models - List available models (legacy)",
+    ":sync - Sync agent to model in last_model.txt",
+    ":gguf add <path> - Register a GGUF model",
+    ":gguf remove <alias> - Remove a GGUF model",
+    ":gguf list - List registered GGUF models",
+    ":a2a on - Enable agent-to-agent mode",
+    ":a2a off - Disable agent-to-agent mode",
+    ":a2a status - Check A2A system status",
+    ":env - Show environment configuration",
+)
+_COMMANDS_JOINED = "\n".join(_COMMANDS)
+_COMMANDS_PRINT = "\nAvailable Commands:\n" + "\n".join(f"  {cmd}" for cmd in _COMMANDS)
+
+# Timestamp format and status icons for :health output
+_TIME_FMT = '%Y-%m-%d %H:%M:%S'
+_STATUS_ICON = {"healthy": "💚", "degraded": "💛", "unhealthy": "🔴", "offline": "⚫"}
+# Cap on agent ids listed when a :health lookup misses
+_MAX_LISTED_AGENTS = 20
 
 
 def get_commands_list():
     """Get list of available commands"""
-    return [
-        ":commands - List all available commands",
-        ":stop - Stop current operation (ingestion, search, etc.)",
-        ":stats - Show performance metrics",
-        ":tools - List available tools (disabled tools hidden)",
-        ":tools --all - List all tools (shows disabled tools marked)",
-        ":tool <tool> - Get the tool description",
-        ":model - List all available models (Ollama + GGUF)",
-        ":model <model> - Switch to model (auto-detects backend)",
-        ":models - List available models (legacy)",
-        ":sync - Sync agent to model in last_model.txt",
-        ":gguf add <path> - Register a GGUF model",
-        ":gguf remove <alias> - Remove a GGUF model",
-        ":gguf list - List registered GGUF models",
-        ":a2a on - Enable agent-to-agent mode",
-        ":a2a off - Disable agent-to-agent mode",
-        ":a2a status - Check A2A system status",
-        ":env - Show environment configuration"
-    ]
+    return _COMMANDS
+
+
+def get_commands_text():
+    """Get available commands as one newline-joined string"""
+    return _COMMANDS_JOINED
 
 
 def list_commands():
     """Print all available commands"""
-    print("\nAvailable Commands:")
-    for cmd in get_commands_list():
-        print(f"  {cmd}")
+    print(_COMMANDS_PRINT)
 
 
 async def handle_a2a_commands(command: str, orchestrator):
     """
     Handle A2A-specific commands
-    Returns result string or None if command not handled
+    Returns (handled, response, new_agent, new_model)
     """
     if command == ":a2a on":
         if orchestrator:
             orchestrator.enable_a2a()
-            return "✅ A2A mode enabled\n   Agents will communicate via messages\n   Use ':a2a status' to see agent status"
-        return "❌ Multi-agent orchestrator not available"
+            return (True, "✅ A2A mode enabled\n   Agents will communicate via messages\n   Use ':a2a status' to see agent status", None, None)
+        return (True, "❌ Multi-agent orchestrator not available", None, None)
 
     elif command == ":a2a off":
         if orchestrator:
             orchestrator.disable_a2a()
-            return "🔗 A2A mode disabled\n   Falling back to multi-agent or single-agent mode"
-        return "❌ Multi-agent orchestrator not available"
+            return (True, "🔗 A2A mode disabled\n   Falling back to multi-agent or single-agent mode", None, None)
+        return (True, "❌ Multi-agent orchestrator not available", None, None)
 
     elif command == ":a2a status":
         if not orchestrator:
-            return "❌ Multi-agent orchestrator not available"
+            return (True, "❌ Multi-agent orchestrator not available", None, None)
 
         status = orchestrator.get_a2a_status()
         if not status["enabled"]:
-            return "A2A mode: DISABLED\n\nUse ':a2a on' to enable agent-to-agent communication"
+            return (True, "A2A mode: DISABLED\n\nUse ':a2a on' to enable agent-to-agent communication", None, None)
 
-        output = ["A2A mode: ENABLED", "=" * 60, ""]
-        output.append("Agent Status:")
-        output.append("-" * 60)
+        output = [
+            "A2A mode: ENABLED", "=" * 60, "",
+            "Agent Status:",
+            "-" * 60
+        ]
 
         for agent_name, agent_status in status["agents"].items():
             busy = "🔴 BUSY" if agent_status["is_busy"] else "🟢 IDLE"
@@ -73,19 +112,25 @@ async def handle_a2a_commands(command: str, orchestrator):
 
             output.append(f"  {agent_name:15} {busy} | Tools: {tools_count:2} | Messages: {msgs:3}")
 
-        output.append("")
-        output.append(f"Message Queue: {status['message_queue_size']} messages")
-        output.append("=" * 60)
+        output.extend((
+            "",
+            f"Message Queue: {status['message_queue_size']} messages",
+            "=" * 60
+        ))
+
+        return (True, "\n".join(output), None, None)
+
+    return (False, None, None, None)
 
-        return "\n".join(output)
 
-    return None
+# Multi-agent mode is always on; the reply never changes
+_MULTI_ON_RESPONSE = "✅ Multi-agent mode enabled\n   Complex queries will be broken down automatically"
 
 
-async def handle_multi_agent_commands(command: str, orchestrator, multi_agent_state):
+def handle_multi_agent_commands(command: str, orchestrator, multi_agent_state):
     """
     Handle multi-agent commands
-    Returns result string or None if command not handled
+    Returns (handled, response, new_agent, new_model)
     """
     # if command == ":multi on":
     #     if orchestrator:
@@ -111,21 +156,22 @@ async def handle_multi_agent_commands(command: str, orchestrator, multi_agent_st
     # return None
 
     multi_agent_state["enabled"] = True
-    return "✅ Multi-agent mode enabled\n   Complex queries will be broken down automatically"
+    return (True, _MULTI_ON_RESPONSE, None, None)
 
 
 async def handle_gguf_commands(command: str):
     """
     Handle GGUF model registry commands
-    Returns result string or None if command not handled
+    Returns (handled, response, new_agent, new_model)
     """
     if not command.startswith(":gguf"):
-        return None
+        return (False, None, None, None)
 
-    parts = command[6:].strip().split(maxsplit=2)
+    # split() already drops surrounding whitespace
+    parts = command.removeprefix(":gguf").split(maxsplit=2)
 
     if not parts or parts[0] == "help":
-        return (
+        return (True, (
             "\n📦 GGUF Model Commands:\n"
             "  :gguf add <path>                   - Register a GGUF model\n"
             "  :gguf remove <alias>               - Remove a GGUF model\n"
@@ -135,7 +181,7 @@ async def handle_gguf_commands(command: str):
             "  :gguf add /path/to/tinyllama.gguf           (uses 'tinyllama' as alias)\n"
             "  :gguf add /path/to/model.gguf my-model      (uses 'my-model' as alias)\n"
             "  :gguf remove tinyllama\n"
-        )
+        ), None, None)
 
     cmd = parts[0]
 
@@ -147,27 +193,28 @@ async def handle_gguf_commands(command: str):
             alias = parts[2]
         else:
             # Extract filename without extension as alias
-            from pathlib import Path
             filename = Path(path).stem  # Gets filename without .gguf extension
             alias = filename
 
         try:
             GGUFModelRegistry.add_model(alias, path, "")
-            return f"\n✅ Model '{alias}' registered!\n   Switch to it with: :model {alias}\n"
+            invalidate_models_listing()
+            return (True, f"\n✅ Model '{alias}' registered!\n   Switch to it with: :model {alias}\n", None, None)
         except Exception as e:
-            return f"❌ Error: {e}"
+            return (True, f"❌ Error: {e}", None, None)
 
     elif cmd == "remove" and len(parts) >= 2:
         alias = parts[1]
         GGUFModelRegistry.remove_model(alias)
-        return f"✅ Removed: {alias}"
+        invalidate_models_listing()
+        return (True, f"✅ Removed: {alias}", None, None)
 
     elif cmd == "list":
         # This will be handled by showing all models
-        return "list_all_models"  # Special signal
+        return (True, "list_all_models", None, None)  # Special signal
 
     else:
-        return "❌ Invalid GGUF command. Use ':gguf help' for usage"
+        return (True, "❌ Invalid GGUF command. Use ':gguf help' for usage", None, None)
 
 
 # SAFE VERSION OF HEALTH COMMANDS - Replace in commands.py
@@ -184,20 +231,22 @@ async def handle_health_commands(command: str, orchestrator):
         if summary.get("status") == "no_agents" or not summary.get("total_agents"):
             return (True, "❌ No agents registered yet. Enable A2A first with ':a2a on'", None, None)
 
-        output = ["🏥 AGENT HEALTH SUMMARY", "=" * 60, ""]
-        output.append(f"Overall Status: {summary.get('status', 'unknown').upper()}")
-        output.append(f"Total Agents: {summary.get('total_agents', 0)}")
-        output.append(f"  💚 Healthy: {summary.get('healthy', 0)}")
-        output.append(f"  💛 Degraded: {summary.get('degraded', 0)}")
-        output.append(f"  🔴 Unhealthy: {summary.get('unhealthy', 0)}")
-        output.append(f"  ⚫ Offline: {summary.get('offline', 0)}")
-        output.append("")
-        output.append(f"Performance:")
-        output.append(f"  Total Tasks: {summary.get('total_tasks', 0)}")
-        output.append(f"  Total Errors: {summary.get('total_errors', 0)}")
-        output.append(f"  Avg Response Time: {summary.get('avg_response_time', 0):.2f}s")
-        output.append(f"  Recent Alerts (5min): {summary.get('recent_alerts', 0)}")
-        output.append("=" * 60)
+        output = [
+            "🏥 AGENT HEALTH SUMMARY", "=" * 60, "",
+            f"Overall Status: {summary.get('status', 'unknown').upper()}",
+            f"Total Agents: {summary.get('total_agents', 0)}",
+            f"  💚 Healthy: {summary.get('healthy', 0)}",
+            f"  💛 Degraded: {summary.get('degraded', 0)}",
+            f"  🔴 Unhealthy: {summary.get('unhealthy', 0)}",
+            f"  ⚫ Offline: {summary.get('offline', 0)}",
+            "",
+            f"Performance:",
+            f"  Total Tasks: {summary.get('total_tasks', 0)}",
+            f"  Total Errors: {summary.get('total_errors', 0)}",
+            f"  Avg Response Time: {summary.get('avg_response_time', 0):.2f}s",
+            f"  Recent Alerts (5min): {summary.get('recent_alerts', 0)}",
+            "=" * 60
+        ]
 
         return (True, "\n".join(output), None, None)
 
@@ -207,18 +256,18 @@ async def handle_health_commands(command: str, orchestrator):
         if not alerts:
             return (True, "✅ No recent alerts", None, None)
 
-        import time
         output = ["🚨 RECENT ALERTS", "=" * 60, ""]
-        for alert in alerts:
-            output.append(f"{alert.level.value.upper()} | {alert.agent_id}")
-            output.append(f"  {alert.message}")
-            output.append(f"  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(alert.timestamp))}")
-            output.append("")
+        output.extend(
+            f"{alert.level.value.upper()} | {alert.agent_id}\n"
+            f"  {alert.message}\n"
+            f"  {time.strftime(_TIME_FMT, time.localtime(alert.timestamp))}\n"
+            for alert in alerts
+        )
 
         return (True, "\n".join(output), None, None)
 
     elif command.startswith(":health "):
-        agent_id = command[8:].strip()
+        agent_id = command.removeprefix(":health ").lstrip()
         health = orchestrator.health_monitor.get_agent_health(agent_id)
 
         # Try with _1 suffix if not found
@@ -228,34 +277,39 @@ async def handle_health_commands(command: str, orchestrator):
                 agent_id = f"{agent_id}_1"
 
         if not health:
-            return (True,
-                    f"❌ Agent '{agent_id}' not found. Available agents: {', '.join(orchestrator.health_monitor.agent_metrics.keys())}",
-                    None, None)
-
-        import time
-        status_icon = {"healthy": "💚", "degraded": "💛", "unhealthy": "🔴", "offline": "⚫"}.get(health.status.value, "❓")
-
-        output = [f"🏥 HEALTH REPORT: {agent_id}", "=" * 60, ""]
-        output.append(f"Status: {status_icon} {health.status.value.upper()}")
-        output.append(f"Uptime: {health.uptime / 60:.1f} minutes")
-        output.append(f"Last Heartbeat: {time.time() - health.last_heartbeat:.1f}s ago")
-        output.append("")
-        output.append(f"Tasks:")
-        output.append(f"  Completed: {health.tasks_completed}")
-        output.append(f"  Failed: {health.tasks_failed}")
+            agent_ids = orchestrator.health_monitor.agent_metrics.keys()
+            available = ", ".join(islice(agent_ids, _MAX_LISTED_AGENTS))
+            if len(agent_ids) > _MAX_LISTED_AGENTS:
+                available += f", ... ({len(agent_ids) - _MAX_LISTED_AGENTS} more)"
+            return (True, f"❌ Agent '{agent_id}' not found. Available agents: {available}", None, None)
+
+        status_icon = _STATUS_ICON.get(health.status.value, "❓")
+
+        output = [
+            f"🏥 HEALTH REPORT: {agent_id}", "=" * 60, "",
+            f"Status: {status_icon} {health.status.value.upper()}",
+            f"Uptime: {health.uptime / 60:.1f} minutes",
+            f"Last Heartbeat: {time.time() - health.last_heartbeat:.1f}s ago",
+            "",
+            f"Tasks:",
+            f"  Completed: {health.tasks_completed}",
+            f"  Failed: {health.tasks_failed}"
+        ]
         if health.tasks_completed + health.tasks_failed > 0:
             success_rate = health.tasks_completed / (health.tasks_completed + health.tasks_failed)
             output.append(f"  Success Rate: {success_rate:.1%}")
-        output.append("")
-        output.append(f"Performance:")
-        output.append(f"  Avg Response Time: {health.avg_response_time:.2f}s")
-        output.append(f"  Queue Size: {health.queue_size}")
-        output.append(f"  Error Count: {health.error_count}")
+        output.extend((
+            "",
+            f"Performance:",
+            f"  Avg Response Time: {health.avg_response_time:.2f}s",
+            f"  Queue Size: {health.queue_size}",
+            f"  Error Count: {health.error_count}"
+        ))
 
         if health.last_error:
             output.append(f"\nLast Error: {health.last_error}")
             if health.last_error_time:
-                output.append(f"  {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(health.last_error_time))}")
+                output.append(f"  {time.strftime(_TIME_FMT, time.localtime(health.last_error_time))}")
 
         output.append("=" * 60)
 
@@ -278,12 +332,14 @@ async def handle_metrics_commands(command: str, orchestrator):
         output = ["📊 COMPARATIVE PERFORMANCE", "=" * 60, ""]
 
         if "overall" in stats:
-            output.append("Overall Statistics:")
-            output.append(f"  Avg Success Rate: {stats['overall']['avg_success_rate']:.1%}")
-            output.append(f"  Avg Duration: {stats['overall']['avg_duration']:.2f}s")
-            output.append(f"  Best Performer: {stats['overall']['best_performer']}")
-            output.append(f"  Fastest Agent: {stats['overall']['fastest_agent']}")
-            output.append("")
+            output.extend((
+                "Overall Statistics:",
+                f"  Avg Success Rate: {stats['overall']['avg_success_rate']:.1%}",
+                f"  Avg Duration: {stats['overall']['avg_duration']:.2f}s",
+                f"  Best Performer: {stats['overall']['best_performer']}",
+                f"  Fastest Agent: {stats['overall']['fastest_agent']}",
+                ""
+            ))
 
         output.append("Per-Agent:")
         for agent_id, data in stats['agents'].items():
@@ -317,14 +373,16 @@ async def handle_negotiation_commands(command: str, orchestrator):
     if command == ":negotiations":
         stats = orchestrator.negotiation_engine.get_statistics()
 
-        output = ["🤝 NEGOTIATION STATISTICS", "=" * 60, ""]
-        output.append(f"Total Proposals: {stats['total_proposals']}")
-        output.append(f"Accepted: {stats['accepted']}")
-        output.append(f"Rejected: {stats['rejected']}")
-        output.append(f"Expired: {stats['expired']}")
-        output.append(f"Success Rate: {stats['success_rate']:.1%}")
-        output.append(f"Active: {stats['active_negotiations']}")
-        output.append("=" * 60)
+        output = [
+            "🤝 NEGOTIATION STATISTICS", "=" * 60, "",
+            f"Total Proposals: {stats['total_proposals']}",
+            f"Accepted: {stats['accepted']}",
+            f"Rejected: {stats['rejected']}",
+            f"Expired: {stats['expired']}",
+            f"Success Rate: {stats['success_rate']:.1%}",
+            f"Active: {stats['active_negotiations']}",
+            "=" * 60
+        ]
 
         return (True, "\n".join(output), None, None)
 
@@ -338,14 +396,16 @@ async def handle_routing_commands(command: str, orchestrator):
     if command == ":routing":
         stats = orchestrator.message_router.get_routing_stats()
 
-        output = ["📡 MESSAGE ROUTING STATISTICS", "=" * 60, ""]
-        output.append(f"Total Routed: {stats['total_routed']}")
-        output.append(f"Failed Routes: {stats['failed_routes']}")
-        output.append(f"Retries: {stats['retries']}")
-        output.append(f"Timeouts: {stats['timeouts']}")
-        output.append(f"Pending: {stats['pending_messages']}")
-        output.append(f"Completed: {stats['completed_messages']}")
-        output.append("=" * 60)
+        output = [
+            "📡 MESSAGE ROUTING STATISTICS", "=" * 60, "",
+            f"Total Routed: {stats['total_routed']}",
+            f"Failed Routes: {stats['failed_routes']}",
+            f"Retries: {stats['retries']}",
+            f"Timeouts: {stats['timeouts']}",
+            f"Pending: {stats['pending_messages']}",
+            f"Completed: {stats['completed_messages']}",
+            "=" * 60
+        ]
 
         return (True, "\n".join(output), None, None)
 
@@ -358,337 +418,467 @@ async def handle_routing_commands(command: str, orchestrator):
         output = ["📬 MESSAGE QUEUE STATUS", "=" * 60, ""]
 
         for agent_id, queue_data in status.items():
-            output.append(f"{agent_id}:")
-            output.append(f"  Queue Size: {queue_data['queue_size']}")
-            output.append(f"  Pending: {queue_data['pending']}")
-            output.append(f"  Critical: {queue_data['priorities']['critical']}")
-            output.append(f"  High: {queue_data['priorities']['high']}")
-            output.append(f"  Normal: {queue_data['priorities']['normal']}")
-            output.append("")
+            output.extend((
+                f"{agent_id}:",
+                f"  Queue Size: {queue_data['queue_size']}",
+                f"  Pending: {queue_data['pending']}",
+                f"  Critical: {queue_data['priorities']['critical']}",
+                f"  High: {queue_data['priorities']['high']}",
+                f"  Normal: {queue_data['priorities']['normal']}",
+                ""
+            ))
 
         return (True, "\n".join(output), None, None)
 
     return (False, None, None, None)
 
+class ToolsIndex(dict):
+    """
+    {tool.name: tool} lookup for one tool list. Built once when the tool list
+    is final and passed to handle_command; also holds the rendered :tools
+    listings, so they live exactly as long as the tool set they describe.
+    """
+
+    def __init__(self, tools):
+        # reversed() so the first tool with a given name wins, as in a linear scan
+        super().__init__((getattr(tool, 'name', str(tool)), tool) for tool in reversed(tools))
+        self.listings = {}
+
+
+# Tool-name substrings used to infer a category when servers aren't known.
+# Order matters: the first category with any matching substring wins.
+_CATEGORY_PATTERNS = (
+    ('todo', ('todo', 'task')),
+    ('knowledge_base', ('entry', 'entries', 'knowledge')),
+    ('plex', ('plex', 'media', 'scene', 'semantic_media', 'import_plex', 'train_recommender', 'recommend', 'record_viewing', 'auto_train', 'auto_recommend')),
+    ('rag', ('rag_',)),
+    ('system', ('system', 'hardware', 'process')),
+    ('location', ('location', 'time', 'weather')),
+    ('text', ('text', 'summarize', 'chunk', 'explain', 'concept')),
+    ('code', ('code', 'debug')),
+)
+
+# One anchored alternation of lookaheads: branches are tried in category order,
+# so match.lastgroup is the same category the ordered substring scan picked
+_CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, patterns))}))(?P<{category}>)"
+        for category, patterns in _CATEGORY_PATTERNS
+    ),
+    re.DOTALL
+)
+
+
 def is_command(text: str) -> bool:
     """Check if text is a command"""
-    return text.strip().startswith(":")
+    # Only the first non-whitespace character matters, so stop there
+    # instead of copying the whole message with strip()
+    for ch in text:
+        if not ch.isspace():
+            return ch == ":"
+    return False
+
+
+@dataclass
+class CommandContext:
+    """Everything a command handler may need, bundled once per handle_command() call"""
+    tools: Any
+    model_name: Any
+    conversation_state: Any
+    models_module: Any
+    system_prompt: Any
+    agent_ref: Any = None
+    create_agent_fn: Any = None
+    logger: Any = None
+    orchestrator: Any = None
+    multi_agent_state: Any = None
+    a2a_state: Any = None
+    mcp_agent: Any = None
+    tools_index: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class CommandSpec:
+    """One dispatch entry: exact specs match the whole line, the rest its first word"""
+    name: str
+    handler: Callable
+    exact: bool
+
+
+# Filled by @register at import time; handle_command dispatches from the
+# dicts built from it below
+_COMMAND_TABLE = []
+
+
+def register(name: str, exact: bool = True):
+    """Register the decorated (command, ctx) coroutine as a command handler"""
+    def decorator(handler):
+        _COMMAND_TABLE.append(CommandSpec(name, handler, exact))
+        return handler
+    return decorator
+
+
+@register(":gguf", exact=False)
+async def _cmd_gguf(command: str, ctx: CommandContext):
+    result = await handle_gguf_commands(command)
+    if result[1] == "list_all_models":
+        # Show all models instead
+        ctx.models_module.print_all_models()
+        return (True, "", None, None)
+    return result
 
 
-async def handle_command(
-    command: str,
-    tools,
-    model_name,
-    conversation_state,
-    models_module,
-    system_prompt,
-    agent_ref=None,
-    create_agent_fn=None,
-    logger=None,
-    orchestrator=None,
-    multi_agent_state=None,
-    a2a_state=None,
-    mcp_agent=None  # ← ADDED mcp_agent parameter
-):
-    """
-    Main command handler compatible with existing CLI/WebSocket interface
+@register(":a2a", exact=False)
+async def _cmd_a2a(command: str, ctx: CommandContext):
+    return await handle_a2a_commands(command, ctx.orchestrator)
 
-    Returns: (handled: bool, response: str, new_agent, new_model)
-    """
-    command = command.strip()
 
-    # GGUF commands
-    if command.startswith(":gguf"):
-        result = await handle_gguf_commands(command)
-        if result:
-            if result == "list_all_models":
-                # Show all models instead
-                models_module.print_all_models()
-                return (True, "", None, None)
-            return (True, result, None, None)
-
-    # A2A commands
-    if command.startswith(":a2a"):
-        result = await handle_a2a_commands(command, orchestrator)
-        if result:
-            return (True, result, None, None)
-
-    # .env values
-    if command == ":env":
-        from client.env_display import format_env_display
-        return True, format_env_display(), None, None
-
-    # Health commands
-    if command.startswith(":health"):
-        result = await handle_health_commands(command, orchestrator)
-        if result[0]:  # If handled
-            return result
-
-    # Metrics commands
-    if command.startswith(":metrics"):
-        result = await handle_metrics_commands(command, orchestrator)
-        if result[0]:  # If handled
-            return result
-
-    # Negotiation commands
-    if command.startswith(":negotiations"):
-        result = await handle_negotiation_commands(command, orchestrator)
-        if result[0]:  # If handled
-            return result
-
-    # Routing commands
-    if command.startswith(":routing"):
-        result = await handle_routing_commands(command, orchestrator)
-        if result[0]:  # If handled
-            return result
-
-    # Multi-agent commands
-    if command.startswith(":multi"):
-        result = await handle_multi_agent_commands(command, orchestrator, multi_agent_state)
-        if result:
-            return (True, result, None, None)
-
-    # List commands
-    if command == ":commands":
-        result = "\n".join(get_commands_list())
-        return (True, result, None, None)
-
-    # Sync with last_model.txt
-    if command == ":sync":
-        last_model = models_module.load_last_model()
-        if not last_model:
-            return (True, "❌ No last_model.txt found", None, None)
-
-        logger.info(f"🔄 Syncing to last_model.txt: {last_model}")
-
-        new_agent, new_model = await models_module.reload_current_model(
-            tools, logger, create_langgraph_agent, a2a_state
-        )
+@register(":env")
+async def _cmd_env(command: str, ctx: CommandContext):
+    return True, format_env_display(), None, None
 
-        if new_agent:
-            return (True, f"✅ Synced to model: {new_model}", new_agent, new_model)
-        else:
-            return (True, f"❌ Failed to sync to: {last_model}", None, None)
 
-    # Stop command
-    if command == ":stop":
-        from client.stop_signal import request_stop
-        request_stop()
-        return (True, "🛑 Stop signal sent - operations will halt at next checkpoint", None, None)
+@register(":health", exact=False)
+async def _cmd_health(command: str, ctx: CommandContext):
+    return await handle_health_commands(command, ctx.orchestrator)
 
-    # Stats command
-    if command == ":stats":
-        try:
-            from client.metrics import prepare_metrics, format_metrics_summary
-            metrics = prepare_metrics()
-            summary = format_metrics_summary(metrics)
-            return (True, summary, None, None)
-        except ImportError:
-            return (True, "📊 Stats system not available", None, None)
 
-    # Tools command - UPDATED to filter disabled tools
-    if command == ":tools" or command == ":tools --all":
-        show_all = command == ":tools --all"
+@register(":metrics", exact=False)
+async def _cmd_metrics(command: str, ctx: CommandContext):
+    return await handle_metrics_commands(command, ctx.orchestrator)
 
-        if not tools:
-            return (True, "No tools available", None, None)
 
-        try:
-            from tools.tool_control import is_tool_enabled, get_disabled_tools
+@register(":negotiations", exact=False)
+async def _cmd_negotiations(command: str, ctx: CommandContext):
+    return await handle_negotiation_commands(command, ctx.orchestrator)
 
-            # Group tools by server/category for better filtering
-            tools_by_server = {}
 
-            # Try to extract server info from agent if available
-            if hasattr(agent_ref, 'tools_by_server'):
-                # We have server information
-                for server_name, server_tools in agent_ref.tools_by_server.items():
-                    # Extract category from server name (e.g., "todo-server" -> "todo")
-                    category = server_name.replace("-server", "").replace("_", "")
+@register(":routing", exact=False)
+async def _cmd_routing(command: str, ctx: CommandContext):
+    return await handle_routing_commands(command, ctx.orchestrator)
 
-                    for tool in server_tools.values():
-                        tool_name = getattr(tool, 'name', str(tool))
-                        enabled = is_tool_enabled(tool_name, category)
 
-                        if server_name not in tools_by_server:
-                            tools_by_server[server_name] = {'enabled': [], 'disabled': []}
+@register(":multi", exact=False)
+async def _cmd_multi(command: str, ctx: CommandContext):
+    return handle_multi_agent_commands(command, ctx.orchestrator, ctx.multi_agent_state)
 
-                        if enabled:
-                            tools_by_server[server_name]['enabled'].append(tool)
-                        else:
-                            tools_by_server[server_name]['disabled'].append(tool)
-            else:
-                # Fallback: Infer category from tool name patterns
-                category_patterns = {
-                    'todo': ['todo', 'task'],
-                    'knowledge_base': ['entry', 'entries', 'knowledge'],
-                    'plex': ['plex', 'media', 'scene', 'semantic_media', 'import_plex', 'train_recommender', 'recommend', 'record_viewing', 'auto_train', 'auto_recommend'],
-                    'rag': ['rag_'],
-                    'system': ['system', 'hardware', 'process'],
-                    'location': ['location', 'time', 'weather'],
-                    'text': ['text', 'summarize', 'chunk', 'explain', 'concept'],
-                    'code': ['code', 'debug'],
-                }
-
-                # Group tools by inferred category
-                tools_by_category = {}
-                for tool in tools:
-                    tool_name = getattr(tool, 'name', str(tool))
-
-                    # Try to match tool to a category
-                    matched_category = 'other'
-                    for category, patterns in category_patterns.items():
-                        if any(pattern in tool_name.lower() for pattern in patterns):
-                            matched_category = category
-                            break
-
-                    if matched_category not in tools_by_category:
-                        tools_by_category[matched_category] = {'enabled': [], 'disabled': []}
-
-                    # Check if tool is enabled for this category
-                    if is_tool_enabled(tool_name, matched_category):
-                        tools_by_category[matched_category]['enabled'].append(tool)
-                    else:
-                        tools_by_category[matched_category]['disabled'].append(tool)
-
-                tools_by_server = tools_by_category
-
-            # Build output
-            output = ["\n" + "=" * 60]
-            if show_all:
-                output.append("ALL TOOLS (including disabled)")
+
+@register(":commands")
+async def _cmd_commands(command: str, ctx: CommandContext):
+    return (True, _COMMANDS_JOINED, None, None)
+
+
+@register(":sync")
+async def _cmd_sync(command: str, ctx: CommandContext):
+    """Sync with last_model.txt"""
+    last_model = ctx.models_module.load_last_model()
+    if not last_model:
+        return (True, "❌ No last_model.txt found", None, None)
+
+    ctx.logger.info("🔄 Syncing to last_model.txt: %s", last_model)
+
+    new_agent, new_model = await ctx.models_module.reload_current_model(
+        ctx.tools, ctx.logger, create_langgraph_agent, ctx.a2a_state
+    )
+
+    if new_agent:
+        return (True, f"✅ Synced to model: {new_model}", new_agent, new_model)
+    else:
+        return (True, f"❌ Failed to sync to: {last_model}", None, None)
+
+
+@register(":stop")
+async def _cmd_stop(command: str, ctx: CommandContext):
+    request_stop()
+    return (True, "🛑 Stop signal sent - operations will halt at next checkpoint", None, None)
+
+
+@register(":stats")
+async def _cmd_stats(command: str, ctx: CommandContext):
+    if not METRICS_AVAILABLE:
+        return (True, "📊 Stats system not available", None, None)
+    metrics = prepare_metrics()
+    summary = format_metrics_summary(metrics)
+    return (True, summary, None, None)
+
+
+@register(":tools")
+@register(":tools --all")
+async def _cmd_tools(command: str, ctx: CommandContext):
+    """Tools command - filters disabled tools unless --all"""
+    show_all = command == ":tools --all"
+
+    if not ctx.tools:
+        return (True, "No tools available", None, None)
+
+    # DISABLED_TOOLS is read once at import, so the listing only changes
+    # with the tool set itself - memoize it on that tool set's index. A
+    # tools_by_server map on the agent can change independently; don't cache then.
+    if ctx.tools_index is None or hasattr(ctx.agent_ref, 'tools_by_server'):
+        return _format_tools_listing(ctx, show_all)
+    listings = ctx.tools_index.listings
+    result = listings.get(show_all)
+    if result is None:
+        result = listings[show_all] = _format_tools_listing(ctx, show_all)
+    return result
+
+
+# What the :tools listing shows per tool, fetched once while grouping
+ToolView = namedtuple('ToolView', 'name desc')
+
+
+def _tool_view(tool, tool_name: str) -> ToolView:
+    """Name plus first description line ('' when there is nothing to show)"""
+    tool_desc = getattr(tool, 'description', 'No description')
+    desc_line = tool_desc.partition('\n')[0][:70] if tool_desc else ''
+    if desc_line == 'No description':
+        desc_line = ''
+    return ToolView(tool_name, desc_line)
+
+
+def _format_tools_listing(ctx: CommandContext, show_all: bool):
+    """Build the :tools / :tools --all response"""
+    if not TOOL_CONTROL_AVAILABLE:
+        # Fallback if tool_control not available
+        tool_list = "\n".join([f"  - {tool.name}" for tool in ctx.tools])
+        return (True, f"Available tools:\n{tool_list}", None, None)
+
+    # Group tools by server/category for better filtering
+    tools_by_server = {}
+
+    # Try to extract server info from agent if available
+    if hasattr(ctx.agent_ref, 'tools_by_server'):
+        # We have server information
+        for server_name, server_tools in ctx.agent_ref.tools_by_server.items():
+            # Extract category from server name (e.g., "todo-server" -> "todo")
+            category = server_name.replace("-server", "").replace("_", "")
+
+            for tool in server_tools.values():
+                tool_name = getattr(tool, 'name', str(tool))
+                enabled = is_tool_enabled(tool_name, category)
+
+                if server_name not in tools_by_server:
+                    tools_by_server[server_name] = {'enabled': [], 'disabled': []}
+
+                if enabled:
+                    tools_by_server[server_name]['enabled'].append(_tool_view(tool, tool_name))
+                else:
+                    tools_by_server[server_name]['disabled'].append(_tool_view(tool, tool_name))
+    else:
+        # Fallback: Infer category from tool name patterns
+        # Group tools by inferred category
+        tools_by_category = {}
+        for tool in ctx.tools:
+            tool_name = getattr(tool, 'name', str(tool))
+
+            # Try to match tool to a category
+            match = _CATEGORY_RE.match(tool_name.lower())
+            matched_category = match.lastgroup if match else 'other'
+
+            if matched_category not in tools_by_category:
+                tools_by_category[matched_category] = {'enabled': [], 'disabled': []}
+
+            # Check if tool is enabled for this category
+            if is_tool_enabled(tool_name, matched_category):
+                tools_by_category[matched_category]['enabled'].append(_tool_view(tool, tool_name))
             else:
-                output.append("AVAILABLE TOOLS")
-            output.append("=" * 60)
-            output.append("")
+                tools_by_category[matched_category]['disabled'].append(_tool_view(tool, tool_name))
 
-            total_enabled = 0
-            total_disabled = 0
-
-            # Show tools grouped by server
-            for server_name in sorted(tools_by_server.keys()):
-                server_data = tools_by_server[server_name]
-                enabled = server_data['enabled']
-                disabled = server_data['disabled']
-
-                # Skip servers with no enabled tools (unless --all)
-                if not enabled and not show_all:
-                    continue
-
-                # Show server name if we have multiple servers
-                if len(tools_by_server) > 1 and server_name != 'all':
-                    output.append(f"\n{server_name}:")
-                    output.append("-" * 60)
-
-                # Show enabled tools
-                for tool in enabled:
-                    tool_name = getattr(tool, 'name', str(tool))
-                    tool_desc = getattr(tool, 'description', 'No description')
-                    desc_line = tool_desc.split('\n')[0][:70] if tool_desc else 'No description'
-                    output.append(f"  ✓ {tool_name}")
-                    if desc_line and desc_line != 'No description':
-                        output.append(f"    {desc_line}")
-
-                total_enabled += len(enabled)
-
-                # Show disabled tools if --all flag
-                if show_all and disabled:
-                    if enabled:  # Add separator if we showed enabled tools
-                        output.append("")
-                    output.append("  DISABLED:")
-                    for tool in disabled:
-                        tool_name = getattr(tool, 'name', str(tool))
-                        tool_desc = getattr(tool, 'description', 'No description')
-                        desc_line = tool_desc.split('\n')[0][:70] if tool_desc else 'No description'
-                        output.append(f"  ✗ {tool_name} [DISABLED]")
-                        if desc_line and desc_line != 'No description':
-                            output.append(f"    {desc_line}")
-
-                total_disabled += len(disabled)
-
-            # Summary
-            output.append("")
-            output.append("=" * 60)
-            output.append(f"Available: {total_enabled} tools")
-
-            if total_disabled > 0:
-                output.append(f"Disabled: {total_disabled} tools (hidden)")
-                if not show_all:
-                    output.append("\nUse ':tools --all' to see disabled tools")
-                output.append("\nCheck DISABLED_TOOLS in .env to modify")
-
-            output.append("=" * 60)
-
-            return (True, "\n".join(output), None, None)
-
-        except ImportError:
-            # Fallback if tool_control not available
-            tool_list = "\n".join([f"  - {tool.name}" for tool in tools])
-            return (True, f"Available tools:\n{tool_list}", None, None)
-
-    # Tool detail command
-    if command.startswith(":tool "):
-        tool_name = command[6:].strip()
-        for tool in tools:
-            if tool.name == tool_name:
-                return (True, f"Tool: {tool.name}\n\n{tool.description}", None, None)
-        return (True, f"Tool '{tool_name}' not found", None, None)
-
-    # Model commands - show sync status
-    if command == ":model":
-        last_model = models_module.load_last_model()
-        current_backend = models_module.detect_backend(last_model) if last_model else "unknown"
-
-        output = []
-        output.append(f"\n📌 Current Model (from last_model.txt):")
-        output.append(f"   {current_backend}/{last_model}")
-        output.append("")
-
-        models_module.print_all_models()
-
-        # Show if current agent might be out of sync
-        if model_name != last_model:
-            output.append(f"\n⚠️  WARNING: Agent might be out of sync!")
-            output.append(f"   Active: {model_name}")
-            output.append(f"   Should be: {last_model}")
-            output.append(f"   Run ':sync' to synchronize")
-
-        return (True, "\n".join(output) if output else "", None, None)
-
-    if command == ":models":
-        # Legacy - show all models
-        models_module.print_all_models()
-        return (True, "", None, None)
+        tools_by_server = tools_by_category
 
-    if command.startswith(":model "):
-        new_model = command[7:].strip()
+    # Build output
+    output = ["\n" + "=" * 60]
+    if show_all:
+        output.append("ALL TOOLS (including disabled)")
+    else:
+        output.append("AVAILABLE TOOLS")
+    output.append("=" * 60)
+    output.append("")
+
+    total_enabled = 0
+    total_disabled = 0
+
+    # Skip servers with no enabled tools (unless --all) before sorting
+    visible = sorted(
+        ((name, data) for name, data in tools_by_server.items() if data['enabled'] or show_all),
+        key=lambda item: item[0]
+    )
+
+    # Show tools grouped by server
+    for server_name, server_data in visible:
+        enabled = server_data['enabled']
+        disabled = server_data['disabled']
+
+        # Show server name if we have multiple servers
+        if len(tools_by_server) > 1 and server_name != 'all':
+            output.append(f"\n{server_name}:")
+            output.append("-" * 60)
+
+        # Show enabled tools
+        for view in enabled:
+            output.append(f"  ✓ {view.name}")
+            if view.desc:
+                output.append(f"    {view.desc}")
+
+        total_enabled += len(enabled)
+
+        # Show disabled tools if --all flag
+        if show_all and disabled:
+            if enabled:  # Add separator if we showed enabled tools
+                output.append("")
+            output.append("  DISABLED:")
+            for view in disabled:
+                output.append(f"  ✗ {view.name} [DISABLED]")
+                if view.desc:
+                    output.append(f"    {view.desc}")
+
+        total_disabled += len(disabled)
+
+    # Summary
+    output.append("")
+    output.append("=" * 60)
+    output.append(f"Available: {total_enabled} tools")
+
+    if total_disabled > 0:
+        output.append(f"Disabled: {total_disabled} tools (hidden)")
+        if not show_all:
+            output.append("\nUse ':tools --all' to see disabled tools")
+        output.append("\nCheck DISABLED_TOOLS in .env to modify")
+
+    output.append("=" * 60)
+
+    return (True, "\n".join(output), None, None)
+
+
+@register(":tool", exact=False)
+async def _cmd_tool(command: str, ctx: CommandContext):
+    """Tool detail command"""
+    tool_name = command.removeprefix(":tool").lstrip()
+    if not tool_name:
+        return (True, "❌ Usage: :tool <tool> - use ':tools' to list tool names", None, None)
+    if ctx.tools_index is not None:
+        tool = ctx.tools_index.get(tool_name)
+    else:
+        tool = next((t for t in ctx.tools if t.name == tool_name), None)
+    if tool:
+        return (True, f"Tool: {tool.name}\n\n{tool.description}", None, None)
+    return (True, f"Tool '{tool_name}' not found", None, None)
 
-        if logger:
-            logger.info(f"Switching to model: {new_model}")
 
-        # Use the unified switch_model that auto-detects backend
-        new_agent = await models_module.switch_model(
-            new_model,
-            tools,
-            logger,
-            create_langgraph_agent,
-            a2a_state=a2a_state
-        )
+@register(":model")
+async def _cmd_model(command: str, ctx: CommandContext):
+    """Show current model and sync status"""
+    models_module = ctx.models_module
+    last_model = models_module.load_last_model()
+    current_backend = models_module.detect_backend(last_model) if last_model else "unknown"
+
+    output = []
+    output.append(f"\n📌 Current Model (from last_model.txt):")
+    output.append(f"   {current_backend}/{last_model}")
+    output.append("")
+
+    models_module.print_all_models()
+
+    # Show if current agent might be out of sync
+    if ctx.model_name != last_model:
+        output.append(f"\n⚠️  WARNING: Agent might be out of sync!")
+        output.append(f"   Active: {ctx.model_name}")
+        output.append(f"   Should be: {last_model}")
+        output.append(f"   Run ':sync' to synchronize")
+
+    return (True, "\n".join(output) if output else "", None, None)
+
+
+@register(":models")
+async def _cmd_models(command: str, ctx: CommandContext):
+    # Legacy - show all models
+    ctx.models_module.print_all_models()
+    return (True, "", None, None)
+
+
+@register(":model", exact=False)
+async def _cmd_model_switch(command: str, ctx: CommandContext):
+    new_model = command.removeprefix(":model").lstrip()
+
+    if ctx.logger:
+        ctx.logger.info("Switching to model: %s", new_model)
+
+    # Use the unified switch_model that auto-detects backend
+    new_agent = await ctx.models_module.switch_model(
+        new_model,
+        ctx.tools,
+        ctx.logger,
+        create_langgraph_agent,
+        a2a_state=ctx.a2a_state
+    )
+
+    if new_agent is None:
+        return (True, f"❌ Model '{new_model}' not loaded", None, None)
 
-        if new_agent is None:
-            return (True, f"❌ Model '{new_model}' not loaded", None, None)
+    # Clear conversation history when switching models
+    # conversation_state["messages"] = []
+    # if logger:
+    #     logger.info("✅ Chat history cleared after model switch")
 
-        # Clear conversation history when switching models
-        # conversation_state["messages"] = []
-        # if logger:
-        #     logger.info("✅ Chat history cleared after model switch")
+    return (True, f"✅ Switched to model: {new_model}\n💬 Chat history cleared", new_agent, new_model)
 
-        return (True, f"✅ Switched to model: {new_model}\n💬 Chat history cleared", new_agent, new_model)
 
-    # # Clear history
-    # if command == ":clear history":
-    #     conversation_state["messages"] = []
-    #     return (True, "✅ Chat history cleared", None, None)
+# ═══════════════════════════════════════════════════════════════════
+# DISPATCH TABLES
+# Exact commands resolve with one dict lookup; everything else is routed
+# by its head token (the first whitespace-separated word) - a second lookup.
+# ═══════════════════════════════════════════════════════════════════
+_EXACT_COMMANDS = {spec.name: spec.handler for spec in _COMMAND_TABLE if spec.exact}
+_HEAD_COMMANDS = {spec.name: spec.handler for spec in _COMMAND_TABLE if not spec.exact}
+
+# Commands that take no arguments - one hash probe tells callers a line is
+# a plain command that can go straight to handle_command
+NO_ARG_COMMANDS = frozenset(_EXACT_COMMANDS)
+
+
+async def handle_command(
+    command: str,
+    tools,
+    model_name,
+    conversation_state,
+    models_module,
+    system_prompt,
+    agent_ref=None,
+    create_agent_fn=None,
+    logger=None,
+    orchestrator=None,
+    multi_agent_state=None,
+    a2a_state=None,
+    mcp_agent=None,  # ← ADDED mcp_agent parameter
+    tools_index=None
+):
+    """
+    Main command handler compatible with existing CLI/WebSocket interface
+
+    Returns: (handled: bool, response: str, new_agent, new_model)
+    """
+    command = command.strip()
 
-    # Command not recognized
-    return (False, None, None, None)
\ No newline at end of file
+    handler = _EXACT_COMMANDS.get(command)
+    if handler is None and command:
+        handler = _HEAD_COMMANDS.get(command.split(None, 1)[0])
+    if handler is None:
+        # Command not recognized
+        return (False, None, None, None)
+
+    ctx = CommandContext(
+        tools=tools,
+        model_name=model_name,
+        conversation_state=conversation_state,
+        models_module=models_module,
+        system_prompt=system_prompt,
+        agent_ref=agent_ref,
+        create_agent_fn=create_agent_fn,
+        logger=logger,
+        orchestrator=orchestrator,
+        multi_agent_state=multi_agent_state,
+        a2a_state=a2a_state,
+        mcp_agent=mcp_agent,
+        tools_index=tools_index
+    )
+    return await handler(command, ctx)
\ No newline at end of file
@@ -3,70 +3,37 @@ Context Tracker - Extracts context from session history for follow-up queries
 """
 
 import re
-from typing import Dict, Optional, List, Any
-from langchain_core.messages import SystemMessage
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Optional, Any
 
+if TYPE_CHECKING:
+    from langchain_core.messages import SystemMessage
 
-class ContextTracker:
-    """Tracks and injects context from session database"""
+# Project paths in user messages, compiled once - must start with /mnt/c/ and have reasonable length
+_PROJECT_PATH_RE = re.compile(r'(/mnt/c/[A-Za-z0-9/_-]{10,200})')
+# Quote/backtick/space characters trimmed off the end of an extracted path
+_PATH_TRIM = '`"\' '
 
-    def __init__(self, session_manager):
-        self.session_manager = session_manager
-
-        self.context_patterns = {
-            "project": {
-                "trigger_phrases": [
-                    r"."  # Match everything - we'll extract paths from ANY message
-                ],
-                "extract_pattern": r"(/mnt/c/[^\s\"'`]+|/[a-zA-Z0-9/_-]+/[^\s\"'`]+)",
-                "key": "project_path"
-            }
-        }
-
-    def extract_context_from_session(self, session_id: int, current_prompt: str) -> Dict[str, Any]:
-        """Extract context from the last few tool calls in the session"""
-        if not session_id or not self.session_manager:
-            return {}
+# session_id -> ((message count, last message timestamp), extracted context).
+# Sessions only grow by appending, so an unchanged key means an unchanged tail.
+_CTX_CACHE = {}
+_CTX_CACHE_MAX = 64
 
-        messages = self.session_manager.get_session_messages(session_id)
-        if not messages:
-            return {}
+# Project block of the injected context message; only the path varies
+_PROJECT_CTX_TEMPLATE = (
+    "Active Project: {p}\n"
+    "All follow-up questions refer to this project unless user specifies a different path.\n"
+    "Use project_path=\"{p}\" for code analysis tools.\n"
+)
 
-        context = {}
-        recent_messages = messages[-10:]
 
-        # Find the most recent assistant message with substantial content
-        last_response = None
-        for msg in reversed(recent_messages):
-            if msg["role"] == "assistant" and len(msg["text"]) > 50:
-                last_response = msg["text"]
-                break
-
-        if last_response:
-            # Extract entities from the last response
-
-            # Project paths
-            project_match = re.search(r'(/mnt/c/[^\s"\'`]+|/[a-zA-Z0-9/_-]+/[^\s"\'`]+)', last_response)
-            if project_match:
-                context["project_path"] = project_match.group(1).rstrip('`"\' ')
-
-            # Movie/media titles
-            media_match = re.search(r'(?:movie|film|show|series).*?["\']([^"\']+)["\']', last_response, re.IGNORECASE)
-            if media_match:
-                context["media_title"] = media_match.group(1)
-
-            # Locations
-            location_match = re.search(r'\b([A-Z][a-z]+(?:,\s*[A-Z]{2})?)\b.*?(?:weather|temperature|forecast)',
-                                       last_response)
-            if location_match:
-                context["location"] = location_match.group(1)
-
-            # Store the full last response as fallback
-            context["last_response_preview"] = last_response[:200]
+class ContextTracker:
+    """Tracks and injects context from session database"""
 
-        return context
+    def __init__(self, session_manager):
+        self.session_manager = session_manager
 
-    def create_context_message(self, context: Dict) -> Optional[SystemMessage]:
+    def create_context_message(self, context: Dict) -> Optional["SystemMessage"]:
         """Create system message with extracted context"""
         if not context:
             return None
@@ -74,9 +41,7 @@ class ContextTracker:
         parts = ["CONVERSATION CONTEXT:\n"]
 
         if "project_path" in context:
-            parts.append(f"Active Project: {context['project_path']}")
-            parts.append(f"All follow-up questions refer to this project unless user specifies a different path.")
-            parts.append(f"Use project_path=\"{context['project_path']}\" for code analysis tools.\n")
+            parts.append(_PROJECT_CTX_TEMPLATE.format(p=context['project_path']))
 
         if "media_title" in context:
             parts.append(f"Discussing Media: {context['media_title']}\n")
@@ -87,6 +52,8 @@ class ContextTracker:
         if "last_response_preview" in context and len(parts) == 1:
             parts.append(f"Recent topic: {context['last_response_preview']}...\n")
 
+        # Deferred: only needed once there is context to inject
+        from langchain_core.messages import SystemMessage
         return SystemMessage(content="\n".join(parts))
 
     def should_inject_context(self, prompt: str, context: Dict) -> bool:
@@ -105,19 +72,24 @@ class ContextTracker:
         if not messages:
             return {}
 
+        cache_key = (len(messages), messages[-1].get("timestamp"))
+        cached = _CTX_CACHE.get(session_id)
+        if cached is not None and cached[0] == cache_key:
+            return dict(cached[1])
+
         context = {}
 
-        # Search from most recent to oldest
-        for msg in reversed(messages[-20:]):
+        # Search from most recent to oldest, without copying the tail
+        for msg in islice(reversed(messages), 20):
             text = msg["text"]
             role = msg["role"]
 
-            # Only extract project paths from USER messages, not assistant responses
-            if "project_path" not in context and role == "user":
-                # More strict regex - must start with /mnt/c/ and have reasonable length
-                project_match = re.search(r'(/mnt/c/[A-Za-z0-9/_-]{10,200})', text)
+            # Only extract project paths from USER messages, not assistant responses;
+            # messages without the /mnt/c/ prefix can't match, so skip the regex
+            if "project_path" not in context and role == "user" and "/mnt/c/" in text:
+                project_match = _PROJECT_PATH_RE.search(text)
                 if project_match:
-                    path = project_match.group(1).rstrip('`"\' ')
+                    path = project_match.group(1).rstrip(_PATH_TRIM)
                     # Validate it's a real path, not garbage
                     if not any(x in path for x in ['*', ':', '**']):
                         context["project_path"] = path
@@ -126,20 +98,31 @@ class ContextTracker:
             if "project_path" in context:
                 break
 
+        if len(_CTX_CACHE) >= _CTX_CACHE_MAX and session_id not in _CTX_CACHE:
+            _CTX_CACHE.clear()
+        _CTX_CACHE[session_id] = (cache_key, dict(context))
         return context
 
+# The client runs a single session manager, so one tracker is reused
+# across turns and only replaced if the session manager changes
+_TRACKER = None
+
+
 def integrate_context_tracking(session_manager, session_id, prompt, conversation_state, logger):
     """Main integration - call before running agent"""
     if not session_manager or not session_id:
         return False
 
-    tracker = ContextTracker(session_manager)
+    global _TRACKER
+    tracker = _TRACKER
+    if tracker is None or tracker.session_manager is not session_manager:
+        tracker = _TRACKER = ContextTracker(session_manager)
     context = tracker.extract_context_from_session(session_id, prompt)
 
     if not context:
         return False
 
-    logger.info(f"📚 Extracted context: {list(context.keys())}")
+    logger.info("📚 Extracted context: %s", list(context))
 
     if not tracker.should_inject_context(prompt, context):
         return False
@@ -147,7 +130,7 @@ def integrate_context_tracking(session_manager, session_id, prompt, conversation
     context_msg = tracker.create_context_message(context)
     if context_msg:
         conversation_state["messages"].append(context_msg)
-        logger.info(f"✅ Context injected: project_path={context.get('project_path')}")
+        logger.info("✅ Context injected: project_path=%s", context.get('project_path'))
         return True
 
     return False
\ No newline at end of file
@@ -4,14 +4,20 @@ Discovers and aggregates skills from all connected MCP servers
 NOW USING SHARED QUERY PATTERNS
 """
 
+import asyncio
+import heapq
 import json
 import logging
-from typing import Dict, List, Optional
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
 from mcp_use.client.client import MCPClient
 
 # Import shared patterns
 from client.query_patterns import needs_tools, is_general_knowledge
 
+# Skill bodies kept in memory between turns (least recently used dropped first)
+SKILL_CONTENT_CACHE_SIZE = 128
+
 
 class DistributedSkillsManager:
     """
@@ -25,6 +31,14 @@ class DistributedSkillsManager:
         self.skills_by_server: Dict[str, List[dict]] = {}
         self.all_skills: Dict[str, dict] = {}  # skill_name -> {server, metadata}
 
+        # Search index, rebuilt whenever skills are discovered
+        self.desc_index: Dict[str, List[str]] = {}  # description word -> skill names
+        self.boost_terms: List[Tuple[str, str, Tuple[str, ...]]] = []  # (skill_name, name_lower, tools_lower)
+        self.skill_rank: Dict[str, int] = {}  # skill_name -> position in all_skills (tie-break)
+
+        # skill_name -> read_skill result; cleared on every discovery
+        self.skill_content_cache: OrderedDict = OrderedDict()
+
     async def discover_all_skills(self):
         """
         Discover skills from all connected MCP servers.
@@ -32,19 +46,27 @@ class DistributedSkillsManager:
         """
         self.logger.info("🔍 Discovering skills from all servers...")
 
-        # Get all available tools across all servers
+        # Skill bodies may have changed along with the skill list
+        self.skill_content_cache.clear()
+
+        # Get all available tools across all servers, querying them concurrently
+        sessions = list(self.mcp_client.sessions.items())
+        results = await asyncio.gather(
+            *[session.list_tools() for _, session in sessions],
+            return_exceptions=True
+        )
+
         all_tools = []
-        for server_name, session in self.mcp_client.sessions.items():
-            try:
-                tools = await session.list_tools()
-                for tool in tools:
-                    all_tools.append({
-                        "server": server_name,
-                        "name": tool.name,
-                        "description": tool.description
-                    })
-            except Exception as e:
-                self.logger.error(f"❌ Failed to list tools from {server_name}: {e}")
+        for (server_name, _), tools in zip(sessions, results):
+            if isinstance(tools, Exception):
+                self.logger.error(f"❌ Failed to list tools from {server_name}: {tools}")
+                continue
+            for tool in tools:
+                all_tools.append({
+                    "server": server_name,
+                    "name": tool.name,
+                    "description": tool.description
+                })
 
         # Find servers that have list_skills tool
         servers_with_skills = [
@@ -58,12 +80,18 @@ class DistributedSkillsManager:
 
         self.logger.info(f"📚 Found {len(servers_with_skills)} server(s) with skills support")
 
-        # Discover skills from each server
-        for server_name in servers_with_skills:
-            try:
-                await self._discover_server_skills(server_name)
-            except Exception as e:
-                self.logger.error(f"❌ Failed to discover skills from {server_name}: {e}")
+        # Discover skills from each server concurrently, then register them in
+        # server order so duplicate names and ranking stay deterministic
+        results = await asyncio.gather(
+            *[self._discover_server_skills(server_name) for server_name in servers_with_skills],
+            return_exceptions=True
+        )
+        for server_name, skills in zip(servers_with_skills, results):
+            if isinstance(skills, Exception):
+                self.logger.error(f"❌ Failed to discover skills from {server_name}: {skills}")
+            elif skills is not None:
+                self._register_server_skills(server_name, skills)
+        self._build_index()
 
         # Log summary
         total_skills = sum(len(skills) for skills in self.skills_by_server.values())
@@ -74,11 +102,11 @@ class DistributedSkillsManager:
             for skill in skills:
                 self.logger.info(f"      - {skill['name']}: {skill['description'][:60]}...")
 
-    async def _discover_server_skills(self, server_name: str):
-        """Discover skills from a specific server"""
+    async def _discover_server_skills(self, server_name: str) -> Optional[List[dict]]:
+        """Fetch the skills advertised by a specific server (None on failure)"""
         session = self.mcp_client.sessions.get(server_name)
         if not session:
-            return
+            return None
 
         try:
             # Call list_skills on the server
@@ -86,20 +114,36 @@ class DistributedSkillsManager:
 
             # Parse the response
             data = json.loads(result.content[0].text)
-            skills = data.get("skills", [])
-
-            self.skills_by_server[server_name] = skills
-
-            # Index skills by name for quick lookup
-            for skill in skills:
-                skill_name = skill["name"]
-                self.all_skills[skill_name] = {
-                    "server": server_name,
-                    **skill
-                }
+            return data.get("skills", [])
 
         except Exception as e:
             self.logger.error(f"Failed to get skills from {server_name}: {e}")
+            return None
+
+    def _register_server_skills(self, server_name: str, skills: List[dict]):
+        """Record a server's skills and index them by name for quick lookup"""
+        self.skills_by_server[server_name] = skills
+
+        for skill in skills:
+            skill_name = skill["name"]
+            self.all_skills[skill_name] = {
+                "server": server_name,
+                **skill
+            }
+
+    def _build_index(self):
+        """Build the inverted description index and boost terms used by find_relevant_skills"""
+        desc_index = defaultdict(list)
+        boost_terms = []
+        for skill_name, skill_info in self.all_skills.items():
+            for word in set(skill_info['description'].lower().split()):
+                desc_index[word].append(skill_name)
+            tools_lower = tuple(tool.lower() for tool in skill_info.get('tools', []))
+            boost_terms.append((skill_name, skill_name.lower(), tools_lower))
+
+        self.desc_index = dict(desc_index)
+        self.boost_terms = boost_terms
+        self.skill_rank = {name: rank for rank, name in enumerate(self.all_skills)}
 
     async def read_skill(self, skill_name: str) -> Optional[str]:
         """
@@ -111,6 +155,11 @@ class DistributedSkillsManager:
         Returns:
             Skill content as JSON string, or None if not found
         """
+        cached = self.skill_content_cache.get(skill_name)
+        if cached is not None:
+            self.skill_content_cache.move_to_end(skill_name)
+            return cached
+
         skill_info = self.all_skills.get(skill_name)
         if not skill_info:
             self.logger.warning(f"⚠️  Skill '{skill_name}' not found")
@@ -125,11 +174,16 @@ class DistributedSkillsManager:
 
         try:
             result = await session.call_tool("read_skill", {"skill_name": skill_name})
-            return result.content[0].text
+            content = result.content[0].text
         except Exception as e:
             self.logger.error(f"❌ Failed to read skill '{skill_name}': {e}")
             return None
 
+        self.skill_content_cache[skill_name] = content
+        if len(self.skill_content_cache) > SKILL_CONTENT_CACHE_SIZE:
+            self.skill_content_cache.popitem(last=False)
+        return content
+
     def get_skills_summary(self) -> str:
         """
         Get a summary of all available skills for system prompt injection.
@@ -137,20 +191,22 @@ class DistributedSkillsManager:
         if not self.all_skills:
             return ""
 
-        summary = "\n# AVAILABLE SKILLS\n\n"
-        summary += "Skills are distributed across your MCP servers. "
-        summary += "Use list_skills() to see all, or read_skill('name') for details.\n\n"
+        parts = [
+            "\n# AVAILABLE SKILLS\n\n"
+            "Skills are distributed across your MCP servers. "
+            "Use list_skills() to see all, or read_skill('name') for details.\n\n"
+        ]
 
         # Group by server
         for server_name, skills in self.skills_by_server.items():
-            summary += f"## {server_name}\n\n"
+            parts.append(f"## {server_name}\n\n")
             for skill in skills:
-                summary += f"- **{skill['name']}**: {skill['description']}\n"
+                parts.append(f"- **{skill['name']}**: {skill['description']}\n")
                 if skill.get('tools'):
-                    summary += f"  - Tools: {', '.join(skill['tools'])}\n"
-            summary += "\n"
+                    parts.append(f"  - Tools: {', '.join(skill['tools'])}\n")
+            parts.append("\n")
 
-        return summary
+        return "".join(parts)
 
     def find_relevant_skills(self, user_query: str, max_skills: int = 3) -> List[dict]:
         """
@@ -164,33 +220,30 @@ class DistributedSkillsManager:
             List of skill metadata dicts with 'name', 'server', 'description'
         """
         query_lower = user_query.lower()
-        query_words = set(query_lower.split())
+        scores = defaultdict(int)
 
-        scores = []
-        for skill_name, skill_info in self.all_skills.items():
-            # Score based on keyword matches
-            desc_lower = skill_info['description'].lower()
-            desc_words = set(desc_lower.split())
-
-            # Count matches (require at least 2 word matches to avoid noise)
-            matches = len(query_words & desc_words)
+        # Score based on keyword matches - only skills sharing a word are visited
+        for word in set(query_lower.split()):
+            for skill_name in self.desc_index.get(word, ()):
+                scores[skill_name] += 1
 
+        for skill_name, name_lower, tools_lower in self.boost_terms:
             # Boost if skill name appears in query
-            if skill_name.lower() in query_lower:
-                matches += 5
+            if name_lower in query_lower:
+                scores[skill_name] += 5
 
             # Boost if tool names match
-            for tool in skill_info.get('tools', []):
-                if tool.lower() in query_lower:
-                    matches += 3
+            for tool in tools_lower:
+                if tool in query_lower:
+                    scores[skill_name] += 3
 
-            # Only include skills with meaningful matches (threshold of 2)
-            if matches >= 2:
-                scores.append((matches, skill_info))
+        # Only include skills with meaningful matches (threshold of 2)
+        matched = [(skill_name, score) for skill_name, score in scores.items() if score >= 2]
 
-        # Sort by score and return top results
-        scores.sort(key=lambda x: x[0], reverse=True)
-        return [info for score, info in scores[:max_skills]]
+        # Highest score first; ties keep discovery order
+        rank = self.skill_rank
+        top = heapq.nlargest(max_skills, matched, key=lambda x: (x[1], -rank[x[0]]))
+        return [self.all_skills[skill_name] for skill_name, _ in top]
 
     def list_all_skills(self) -> List[dict]:
         """Get list of all skills with metadata"""
@@ -243,22 +296,32 @@ async def inject_relevant_skills_into_messages(
 
     logger.info(f"📚 Found {len(relevant)} relevant skill(s) for query")
 
-    # Read full content of relevant skills
-    skills_content = "\n\n# RELEVANT SKILLS FOR THIS QUERY\n\n"
-
+    # Read full content of relevant skills concurrently; results keep `relevant` order
     for skill_info in relevant:
+        logger.info(f"   - Loading: {skill_info['name']} (from {skill_info['server']})")
+
+    contents = await asyncio.gather(
+        *[skills_manager.read_skill(skill_info['name']) for skill_info in relevant],
+        return_exceptions=True
+    )
+
+    parts = ["\n\n# RELEVANT SKILLS FOR THIS QUERY\n\n"]
+
+    for skill_info, content in zip(relevant, contents):
         skill_name = skill_info['name']
-        logger.info(f"   - Loading: {skill_name} (from {skill_info['server']})")
+        if isinstance(content, Exception):
+            logger.error(f"❌ Failed to load skill '{skill_name}': {content}")
+            continue
 
         try:
-            content = await skills_manager.read_skill(skill_name)
             if content:
                 data = json.loads(content)
-                skills_content += f"## {skill_name}\n\n"
-                skills_content += f"{data['content']}\n\n"
+                parts.append(f"## {skill_name}\n\n{data['content']}\n\n")
         except Exception as e:
             logger.error(f"❌ Failed to load skill '{skill_name}': {e}")
 
+    skills_content = "".join(parts)
+
     # Inject into system message
     if messages and hasattr(messages[0], 'type') and messages[0].type == "system":
         # Append to existing system message
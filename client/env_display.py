@@ -4,6 +4,42 @@ Environment Variable Display Utility
 import os
 from typing import Dict, Any
 
+# (section heading, variables shown under it) - in display order
+_SECTIONS = (
+    ("🎬 Plex Media Server:", ("PLEX_URL", "PLEX_TOKEN")),
+    ("🌤️  Weather API:", ("WEATHER_TOKEN",)),
+    ("🔗 A2A Protocol:", ("A2A_ENDPOINTS", "A2A_EXPOSED_TOOLS")),
+    ("🔍 LangSearch Web Search:", ("LANGSEARCH_TOKEN",)),
+    ("🤖 Agent Configuration:", ("MAX_MESSAGE_HISTORY",)),
+    ("⚡ RAG Performance:", ("CONCURRENT_LIMIT", "EMBEDDING_BATCH_SIZE", "DB_FLUSH_BATCH_SIZE")),
+)
+
+# Sensitive tokens are masked; unset plain values show their default
+_MASKED_KEYS = frozenset(("PLEX_TOKEN", "WEATHER_TOKEN", "LANGSEARCH_TOKEN"))
+_DEFAULTS = {
+    "MAX_MESSAGE_HISTORY": "20",
+    "CONCURRENT_LIMIT": "1",
+    "EMBEDDING_BATCH_SIZE": "10",
+    "DB_FLUSH_BATCH_SIZE": "30",
+}
+
+# Every variable the display reads; their raw values key the formatted cache
+_TRACKED_KEYS = tuple(key for _, keys in _SECTIONS for key in keys)
+_FMT_CACHE: Dict[tuple, str] = {}
+_FMT_CACHE_MAX = 8
+
+
+def _display_values(raw_values: tuple) -> Dict[str, str]:
+    """Map raw env values (in _TRACKED_KEYS order) to their display strings"""
+    values = {}
+    for key, value in zip(_TRACKED_KEYS, raw_values):
+        if key in _MASKED_KEYS:
+            # Mask token but handle empty/None
+            values[key] = "*" * len(value) if value else "(not set)"
+        else:
+            values[key] = value or _DEFAULTS.get(key, "(not set)")
+    return values
+
 
 def get_env_display() -> Dict[str, Any]:
     """
@@ -11,41 +47,9 @@ def get_env_display() -> Dict[str, Any]:
     Masks sensitive tokens.
 
     Returns:
-        Dictionary with categorized env vars
+        Flat dictionary of variable name -> display value
     """
-
-    def mask_token(value: str) -> str:
-        """Mask token but handle empty/None"""
-        if not value:
-            return "(not set)"
-        return "*" * len(value)
-
-    env_vars = {
-        "plex": {
-            "PLEX_URL": os.getenv("PLEX_URL") or "(not set)",
-            "PLEX_TOKEN": mask_token(os.getenv("PLEX_TOKEN"))
-        },
-        "weather": {
-            "WEATHER_TOKEN": mask_token(os.getenv("WEATHER_TOKEN"))
-        },
-        "a2a": {
-            "A2A_ENDPOINTS": os.getenv("A2A_ENDPOINTS") or "(not set)",
-            "A2A_EXPOSED_TOOLS": os.getenv("A2A_EXPOSED_TOOLS") or "(not set)"
-        },
-        "langsearch": {
-            "LANGSEARCH_TOKEN": mask_token(os.getenv("LANGSEARCH_TOKEN"))
-        },
-        "agent": {
-            "MAX_MESSAGE_HISTORY": os.getenv("MAX_MESSAGE_HISTORY") or "20"
-        },
-        "rag_performance": {
-            "CONCURRENT_LIMIT": os.getenv("CONCURRENT_LIMIT") or "1",
-            "EMBEDDING_BATCH_SIZE": os.getenv("EMBEDDING_BATCH_SIZE") or "10",
-            "DB_FLUSH_BATCH_SIZE": os.getenv("DB_FLUSH_BATCH_SIZE") or "30"
-        }
-    }
-
-    return env_vars
+    return _display_values(tuple(map(os.environ.get, _TRACKED_KEYS)))
 
 
 def format_env_display() -> str:
@@ -55,41 +59,22 @@ def format_env_display() -> str:
     Returns:
         Formatted string (wrapped in code block for web UI)
     """
-    env_vars = get_env_display()
-
-    output = []
-    output.append("📋 ENVIRONMENT CONFIGURATION")
-    output.append("=" * 50)
-
-    # Plex
-    output.append("\n🎬 Plex Media Server:")
-    output.append(f"   PLEX_URL: {env_vars['plex']['PLEX_URL']}")
-    output.append(f"   PLEX_TOKEN: {env_vars['plex']['PLEX_TOKEN']}")
-
-    # Weather
-    output.append("\n🌤️  Weather API:")
-    output.append(f"   WEATHER_TOKEN: {env_vars['weather']['WEATHER_TOKEN']}")
-
-    # A2A
-    output.append("\n🔗 A2A Protocol:")
-    output.append(f"   A2A_ENDPOINTS: {env_vars['a2a']['A2A_ENDPOINTS']}")
-    output.append(f"   A2A_EXPOSED_TOOLS: {env_vars['a2a']['A2A_EXPOSED_TOOLS']}")
-
-    # LangSearch
-    output.append("\n🔍 LangSearch Web Search:")
-    output.append(f"   LANGSEARCH_TOKEN: {env_vars['langsearch']['LANGSEARCH_TOKEN']}")
-
-    # Agent Config
-    output.append("\n🤖 Agent Configuration:")
-    output.append(f"   MAX_MESSAGE_HISTORY: {env_vars['agent']['MAX_MESSAGE_HISTORY']}")
-
-    # RAG Performance
-    output.append("\n⚡ RAG Performance:")
-    output.append(f"   CONCURRENT_LIMIT: {env_vars['rag_performance']['CONCURRENT_LIMIT']}")
-    output.append(f"   EMBEDDING_BATCH_SIZE: {env_vars['rag_performance']['EMBEDDING_BATCH_SIZE']}")
-    output.append(f"   DB_FLUSH_BATCH_SIZE: {env_vars['rag_performance']['DB_FLUSH_BATCH_SIZE']}")
-
+    # One pass over os.environ serves as both the cache key and the values
+    key = tuple(map(os.environ.get, _TRACKED_KEYS))
+    formatted = _FMT_CACHE.get(key)
+    if formatted is not None:
+        return formatted
+
+    values = _display_values(key)
+
+    output = ["📋 ENVIRONMENT CONFIGURATION", "=" * 50]
+    for heading, keys in _SECTIONS:
+        output.append(f"\n{heading}")
+        output.extend(f"   {name}: {values[name]}" for name in keys)
     output.append("\n" + "=" * 50)
 
     formatted = "\n".join(output)
+    if len(_FMT_CACHE) >= _FMT_CACHE_MAX:
+        _FMT_CACHE.clear()
+    _FMT_CACHE[key] = formatted
     return formatted
\ No newline at end of file
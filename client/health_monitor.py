@@ -9,6 +9,10 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
+from itertools import islice
+
+# Alerts kept in memory; older ones fall off the ring
+ALERT_RING_SIZE = 1024
 
 
 class HealthStatus(Enum):
@@ -77,7 +81,7 @@ class HealthMonitor:
     def __init__(self, logger):
         self.logger = logger
         self.agent_metrics: Dict[str, HealthMetrics] = {}
-        self.alerts: List[HealthAlert] = []
+        self.alerts: deque = deque(maxlen=ALERT_RING_SIZE)
 
         # Thresholds for alerts
         self.thresholds = {
@@ -357,21 +361,22 @@ class HealthMonitor:
 
     def get_recent_alerts(self, limit: int = 50, level: AlertLevel = None) -> List[HealthAlert]:
         """Get recent alerts, optionally filtered by level"""
-        alerts = self.alerts[-limit:] if limit else self.alerts
+        # Most recent first; only the last `limit` entries are visited
+        alerts = islice(reversed(self.alerts), limit) if limit else reversed(self.alerts)
 
         if level:
-            alerts = [a for a in alerts if a.level == level]
+            return [a for a in alerts if a.level == level]
 
-        return list(reversed(alerts))  # Most recent first
+        return list(alerts)
 
     def clear_alerts(self, older_than: float = None):
         """Clear old alerts"""
         if older_than:
             current_time = time.time()
-            self.alerts = [
-                a for a in self.alerts
-                if current_time - a.timestamp < older_than
-            ]
+            self.alerts = deque(
+                (a for a in self.alerts if current_time - a.timestamp < older_than),
+                maxlen=ALERT_RING_SIZE
+            )
         else:
             self.alerts.clear()
 
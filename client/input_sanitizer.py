@@ -9,6 +9,84 @@ import logging
 
 logger = logging.getLogger("mcp_client")
 
+# Patterns that try to override system instructions
+_INJECTION_PATTERNS = (
+    r'(?i)ignore\s+(all\s+)?previous\s+instructions?',
+    r'(?i)disregard\s+(all\s+)?previous\s+instructions?',
+    r'(?i)forget\s+(all\s+)?previous\s+instructions?',
+    r'(?i)you\s+are\s+now\s+a\s+',
+    r'(?i)system\s*:\s*',  # Fake system messages
+    r'(?i)assistant\s*:\s*',  # Fake assistant messages
+    r'(?i)\[INST\]',  # Llama instruction tags
+    r'(?i)\[/INST\]',
+    r'(?i)<\|im_start\|>',  # ChatML tags
+    r'(?i)<\|im_end\|>',
+)
+
+# Obvious injection attempts rejected by is_safe_input
+_DANGEROUS_PATTERNS = (
+    r'(?i)ignore\s+all\s+previous\s+instructions',
+    r'(?i)you\s+are\s+now\s+DAN',
+    r'(?i)jailbreak',
+)
+
+# Compiled once; kept as separate searches - CPython's re scans for each
+# pattern's literal prefix, which beats one combined alternation here
+_INJECTION_RES = tuple((p, re.compile(p)) for p in _INJECTION_PATTERNS)
+_DANGEROUS_RES = tuple((p, re.compile(p)) for p in _DANGEROUS_PATTERNS)
+# Every injection pattern contains at least one of these literals (lowercase);
+# \s+ separators rule out multi-word triggers. Only valid for ASCII text -
+# (?i) also folds a few non-ASCII letters (e.g. U+017F) onto s/k/i
+_INJECTION_TRIGGERS = (
+    'ignore', 'disregard', 'forget', 'you', 'system', 'assistant',
+    '[inst', '[/inst', '<|im_',
+)
+# Runs of 2+ spaces collapse to one space, 3+ newlines to two - in one pass
+_WHITESPACE_RUN_RE = re.compile(r' {2,}|\n{3,}')
+
+
+def _collapse_run(match: re.Match) -> str:
+    return ' ' if match.group(0)[0] == ' ' else '\n\n'
+
+
+# Escaped markdown restored after html.escape, longest entity first
+_MD_UNESCAPE = {
+    '&ast;&ast;': '**',  # Bold
+    '&ast;': '*',  # Italic/lists
+    '&#x60;&#x60;&#x60;': '```',  # Code blocks
+    '&#x60;': '`',  # Inline code
+}
+_MD_UNESCAPE_RE = re.compile('|'.join(map(re.escape, _MD_UNESCAPE)))
+
+# str.translate table deleting control characters except newline and tab
+_CTRL_TABLE = dict.fromkeys((i for i in range(32) if i not in (9, 10)), None)
+
+MAX_INPUT_LENGTH = 10000  # ~2500 tokens for most models
+
+
+def _is_plain_text(text: str) -> bool:
+    """True when escaping, whitespace normalization and truncation are all no-ops"""
+    return (
+        len(text) <= MAX_INPUT_LENGTH
+        and text.isascii()
+        and '\n' not in text
+        and '  ' not in text
+        and '<' not in text
+        and '>' not in text
+        and '&' not in text
+    )
+
+
+def _warn_on_injection(text: str) -> None:
+    if text.isascii():
+        lowered = text.lower()
+        if not any(trigger in lowered for trigger in _INJECTION_TRIGGERS):
+            return
+    for pattern, regex in _INJECTION_RES:
+        if regex.search(text):
+            logger.warning(f"⚠️  Potential prompt injection detected: {pattern}")
+            # Don't remove - just log and continue (user might have legitimate use)
+
 
 def sanitize_user_input(text: str, preserve_markdown: bool = True) -> str:
     """
@@ -35,53 +113,40 @@ def sanitize_user_input(text: str, preserve_markdown: bool = True) -> str:
     original_length = len(text)
 
     # 1. Remove null bytes and control characters (except newline, tab)
-    text = ''.join(char for char in text if char == '\n' or char == '\t' or ord(char) >= 32)
+    text = text.translate(_CTRL_TABLE)
+
+    # Fast path: a typical short single-line chat message needs none of the
+    # transforms below, but still goes through the injection scan
+    if _is_plain_text(text):
+        text = text.strip()
+        _warn_on_injection(text)
+        if len(text) < original_length * 0.9:
+            logger.info(f"📝 Input sanitized: {original_length} → {len(text)} chars")
+        return text
 
     # 2. Escape HTML entities to prevent tag confusion
     # This handles: <div>, <script>, <!-- comments -->, etc.
-    text = html.escape(text, quote=False)  # Don't escape quotes (for markdown)
+    if '<' in text or '>' in text or '&' in text:
+        text = html.escape(text, quote=False)  # Don't escape quotes (for markdown)
 
     # 3. Normalize excessive whitespace (but preserve single newlines)
-    # Replace multiple spaces with single space
-    text = re.sub(r' {2,}', ' ', text)
-    # Replace 3+ newlines with 2 newlines
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    # Replace multiple spaces with single space and 3+ newlines with 2 newlines
+    text = _WHITESPACE_RUN_RE.sub(_collapse_run, text)
     # Remove leading/trailing whitespace from each line
     text = '\n'.join(line.strip() for line in text.split('\n'))
 
     # 4. Remove dangerous prompt injection patterns
-    # Patterns that try to override system instructions
-    injection_patterns = [
-        r'(?i)ignore\s+(all\s+)?previous\s+instructions?',
-        r'(?i)disregard\s+(all\s+)?previous\s+instructions?',
-        r'(?i)forget\s+(all\s+)?previous\s+instructions?',
-        r'(?i)you\s+are\s+now\s+a\s+',
-        r'(?i)system\s*:\s*',  # Fake system messages
-        r'(?i)assistant\s*:\s*',  # Fake assistant messages
-        r'(?i)\[INST\]',  # Llama instruction tags
-        r'(?i)\[/INST\]',
-        r'(?i)<\|im_start\|>',  # ChatML tags
-        r'(?i)<\|im_end\|>',
-    ]
-
-    for pattern in injection_patterns:
-        if re.search(pattern, text):
-            logger.warning(f"⚠️  Potential prompt injection detected: {pattern}")
-            # Don't remove - just log and continue (user might have legitimate use)
+    _warn_on_injection(text)
 
     # 5. Limit length (prevent token overflow attacks)
-    max_length = 10000  # ~2500 tokens for most models
-    if len(text) > max_length:
-        logger.warning(f"⚠️  Input truncated from {len(text)} to {max_length} characters")
-        text = text[:max_length] + "\n\n[Input truncated due to length]"
+    if len(text) > MAX_INPUT_LENGTH:
+        logger.warning(f"⚠️  Input truncated from {len(text)} to {MAX_INPUT_LENGTH} characters")
+        text = text[:MAX_INPUT_LENGTH] + "\n\n[Input truncated due to length]"
 
     # 6. If markdown should be preserved, unescape certain patterns
-    if preserve_markdown:
+    if preserve_markdown and '&' in text:
         # Restore common markdown that was escaped
-        text = text.replace('&ast;&ast;', '**')  # Bold
-        text = text.replace('&ast;', '*')  # Italic/lists
-        text = text.replace('&#x60;&#x60;&#x60;', '```')  # Code blocks
-        text = text.replace('&#x60;', '`')  # Inline code
+        text = _MD_UNESCAPE_RE.sub(lambda m: _MD_UNESCAPE[m.group(0)], text)
 
     # Log if significant changes were made
     if len(text) < original_length * 0.9:
@@ -115,14 +180,8 @@ def is_safe_input(text: str) -> tuple[bool, str]:
         return False, "Contains invalid Unicode"
 
     # Check for obvious injection attempts
-    dangerous_patterns = [
-        r'(?i)ignore\s+all\s+previous\s+instructions',
-        r'(?i)you\s+are\s+now\s+DAN',
-        r'(?i)jailbreak',
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, text):
+    for pattern, regex in _DANGEROUS_RES:
+        if regex.search(text):
             return False, f"Potential injection: {pattern}"
 
     return True, "Safe"
@@ -138,7 +197,7 @@ def sanitize_command(text: str) -> str:
         return text
 
     # Remove control characters (except newline, tab)
-    text = ''.join(char for char in text if char == '\n' or char == '\t' or ord(char) >= 32)
+    text = text.translate(_CTRL_TABLE)
 
     # Normalize whitespace
     text = ' '.join(text.split())
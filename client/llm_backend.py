@@ -186,16 +186,35 @@ class LLMBackendManager:
 class GGUFModelRegistry:
     """Manages GGUF model registry"""
 
+    # Parsed registry plus the (mtime_ns, size) it was read at; a stat() is
+    # enough to tell whether the file changed since
+    _cache: Optional[Dict[str, dict]] = None
+    _cache_key: Optional[tuple] = None
+
     @staticmethod
-    def load_models() -> Dict[str, dict]:
-        if not os.path.exists(GGUF_MODELS_FILE):
-            return {}
+    def _file_key() -> Optional[tuple]:
         try:
-            with open(GGUF_MODELS_FILE, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load GGUF registry: {e}")
+            st = os.stat(GGUF_MODELS_FILE)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def load_models() -> Dict[str, dict]:
+        key = GGUFModelRegistry._file_key()
+        if key is None:
             return {}
+        if key != GGUFModelRegistry._cache_key:
+            try:
+                with open(GGUF_MODELS_FILE, 'r') as f:
+                    models = json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load GGUF registry: {e}")
+                return {}
+            GGUFModelRegistry._cache = models
+            GGUFModelRegistry._cache_key = key
+        # Shallow copy - callers add/remove aliases before save_models()
+        return dict(GGUFModelRegistry._cache)
 
     @staticmethod
     def save_models(models: Dict[str, dict]):
@@ -204,6 +223,9 @@ class GGUFModelRegistry:
                 json.dump(models, f, indent=2)
         except Exception as e:
             logger.error(f"Failed to save GGUF registry: {e}")
+            return
+        GGUFModelRegistry._cache = dict(models)
+        GGUFModelRegistry._cache_key = GGUFModelRegistry._file_key()
 
     @staticmethod
     def add_model(alias: str, path: str, description: str = ""):
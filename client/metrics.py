@@ -3,6 +3,7 @@ Metrics Module
 Tracks performance metrics for MCP components with timestamps
 """
 
+import heapq
 import time
 from collections import defaultdict
 
@@ -82,4 +83,38 @@ def prepare_metrics():
             }
         },
         "overall_errors": total_errors
-    }
\ No newline at end of file
+    }
+
+# Horizontal rule for the text report
+_RULE = "=" * 60
+
+
+def format_metrics_summary(data):
+    """Render prepare_metrics() output as the plain-text :stats report"""
+    agent, llm, tools = data["agent"], data["llm"], data["tools"]
+
+    report = (
+        f"{_RULE}\nPERFORMANCE METRICS\n{_RULE}\n\n"
+        f"AGENT EXECUTION:\n"
+        f"  Total Runs:    {agent['runs']}\n"
+        f"  Errors:        {agent['errors']} ({agent['error_rate']}%)\n"
+        f"  Avg Time:      {agent['avg_time']:.2f}s\n\n"
+        f"LLM CALLS:\n"
+        f"  Total Calls:   {llm['calls']}\n"
+        f"  Errors:        {llm['errors']}\n"
+        f"  Avg Time:      {llm['avg_time']:.2f}s\n\n"
+        f"TOOL CALLS:\n"
+        f"  Total Calls:   {tools['total_calls']}\n"
+        f"  Errors:        {tools['total_errors']}"
+    )
+
+    # Most-used tools first; only the top 10 are ever shown, so skip the full sort
+    sorted_tools = heapq.nlargest(10, tools["per_tool"].items(), key=lambda x: x[1]["calls"])
+    if sorted_tools:
+        tool_rows = "\n".join([
+            f"    {name:30s} {stats['calls']:3d} calls, {stats['avg_time']:5.2f}s avg, {stats['errors']} errors"
+            for name, stats in sorted_tools
+        ])
+        report += f"\n\n  Top Tools:\n{tool_rows}"
+
+    return f"{report}\n\nTotal Errors:  {data['overall_errors']}\n{_RULE}"
\ No newline at end of file
@@ -6,12 +6,20 @@ Handles both Ollama and GGUF models with automatic backend switching
 import os
 import subprocess
 import logging
+import time
 from client.llm_backend import LLMBackendManager, GGUFModelRegistry
 
 logger = logging.getLogger(__name__)
 
 MODEL_STATE_FILE = "last_model.txt"
 
+# Last rendered :models listing as (backend, text, rendered at). Rendering
+# shells out to "ollama list" and reads last_model.txt, so the text is reused
+# until the model changes (invalidate_models_listing) or the TTL runs out -
+# the TTL is what picks up models pulled outside the client.
+_MODELS_LISTING = None
+_MODELS_LISTING_TTL = 30.0  # seconds
+
 
 def get_ollama_models():
     """Get list of Ollama models"""
@@ -112,6 +120,13 @@ def save_last_model(model_name):
     """Save current model to file"""
     with open(MODEL_STATE_FILE, "w") as f:
         f.write(model_name)
+    invalidate_models_listing()
+
+
+def invalidate_models_listing():
+    """Drop the memoized :models listing (model switched, added or removed)"""
+    global _MODELS_LISTING
+    _MODELS_LISTING = None
 
 
 async def switch_model(model_name, tools, logger, create_agent_fn, a2a_state=None):
@@ -217,43 +232,57 @@ async def switch_model(model_name, tools, logger, create_agent_fn, a2a_state=Non
     return agent
 
 
-def print_all_models():
-    """Print unified list of all available models"""
-    all_models = get_all_models()
-
-    if not all_models:
-        print("\n📦 No models available")
-        print("   Ollama: ollama pull <model>")
-        print("   GGUF: :gguf add <alias> <path>")
-        return
-
-    # Group by backend
-    ollama = [m for m in all_models if m["backend"] == "ollama"]
-    gguf = [m for m in all_models if m["backend"] == "gguf"]
-
+def format_all_models():
+    """Render the unified model list as one string (memoized, see _MODELS_LISTING)"""
+    global _MODELS_LISTING
     current_backend = LLMBackendManager.get_backend_type()
-    current_model = load_last_model()
+    cached = _MODELS_LISTING
+    if (cached is not None and cached[0] == current_backend
+            and time.monotonic() - cached[2] < _MODELS_LISTING_TTL):
+        return cached[1]
 
-    print("\n📦 Available Models")
-    print(f"   Current: {current_backend}/{current_model}\n")
+    all_models = get_all_models()
+    current_model = load_last_model()
 
-    if ollama:
-        print("🔹 Ollama:")
-        for m in ollama:
-            marker = "→" if m["name"] == current_model else " "
-            print(f"   {marker} {m['name']}")
-        print()
+    if not all_models:
+        lines = [
+            "\n📦 No models available",
+            "   Ollama: ollama pull <model>",
+            "   GGUF: :gguf add <alias> <path>"
+        ]
+    else:
+        # Group by backend
+        ollama = [m for m in all_models if m["backend"] == "ollama"]
+        gguf = [m for m in all_models if m["backend"] == "gguf"]
+
+        lines = ["\n📦 Available Models", f"   Current: {current_backend}/{current_model}\n"]
+
+        if ollama:
+            lines.append("🔹 Ollama:")
+            for m in ollama:
+                marker = "→" if m["name"] == current_model else " "
+                lines.append(f"   {marker} {m['name']}")
+            lines.append("")
+
+        if gguf:
+            lines.append("🔹 GGUF (Local):")
+            for m in gguf:
+                marker = "→" if m["name"] == current_model else " "
+                size = m.get("size_mb", 0)
+                lines.append(f"   {marker} {m['name']} ({size} MB)")
+            lines.append("")
+
+        lines.append("💡 Switch: :model <name>")
+        lines.append("   (Backend switches automatically)\n")
+
+    text = "\n".join(lines)
+    _MODELS_LISTING = (current_backend, text, time.monotonic())
+    return text
 
-    if gguf:
-        print("🔹 GGUF (Local):")
-        for m in gguf:
-            marker = "→" if m["name"] == current_model else " "
-            size = m.get("size_mb", 0)
-            print(f"   {marker} {m['name']} ({size} MB)")
-        print()
 
-    print("💡 Switch: :model <name>")
-    print("   (Backend switches automatically)\n")
+def print_all_models():
+    """Print unified list of all available models"""
+    print(format_all_models())
 
 
 async def reload_current_model(tools, logger, create_agent_fn, a2a_state=None):
@@ -281,6 +310,7 @@ async def reload_current_model(tools, logger, create_agent_fn, a2a_state=None):
 
     # Set backend
     os.environ["LLM_BACKEND"] = backend
+    invalidate_models_listing()
 
     try:
         logger.info(f"🔄 Reloading model from last_model.txt: {backend}/{model_name}")
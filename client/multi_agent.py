@@ -412,84 +412,16 @@ CRITICAL: Never make up item IDs! Only use IDs returned by plex_find_unprocessed
 
             # Step 2: Execute subtasks with tracking
             self.logger.info(f"🎭 Executing {len(subtasks)} subtasks via A2A")
-            results = {}
 
-            for subtask in subtasks:
-                # Check stop before each subtask
-                if is_stop_requested():
-                    self.logger.warning("🛑 A2A execution stopped")
-                    break
-
-                task_id = subtask["id"]
-                agent_role = subtask["agent"]
-                description = subtask["description"]
-                depends_on = subtask.get("depends_on", [])
-
-                # Build context from dependencies
-                context = {"user_request": user_request}
-                for dep_id in depends_on:
-                    if dep_id in results:
-                        context[f"result_{dep_id}"] = results[dep_id]
-
-                agent = self.a2a_agents.get(agent_role)
-                if not agent:
-                    self.logger.warning(f"⚠️ Agent {agent_role} not found")
-                    results[task_id] = f"Agent {agent_role} not available"
-                    continue
-
-                # Execute task with tracking
-                self.logger.info(f"▶️  Executing {task_id} with {agent_role}")
-                task_start = time.time()
-
-                try:
-                    result = await agent.execute_task(description, context)
-                    results[task_id] = result
-                    success = True
-                    error = None
-                    self.logger.info(f"✅ {task_id} completed")
-
-                except Exception as e:
-                    results[task_id] = f"Error: {str(e)}"
-                    success = False
-                    error = str(e)
-                    self.logger.error(f"❌ {task_id} failed: {e}")
+            async def dispatch(subtask: Dict[str, Any], results: Dict[str, Any]) -> Any:
+                return await self._dispatch_a2a_subtask(subtask, results, user_request)
 
-                    # Record error with health monitor
-                    self.health_monitor.record_error(agent.agent_id, error)
-
-                task_end = time.time()
-                task_duration = task_end - task_start
-
-                # Record performance metrics
-                from client.performance_metrics import TaskMetrics
-                task_metrics = TaskMetrics(
-                    task_id=task_id,
-                    agent_id=agent.agent_id,
-                    task_type=agent_role,
-                    start_time=task_start,
-                    end_time=task_end,
-                    duration=task_duration,
-                    success=success,
-                    tools_used=list(agent.tools.keys()) if hasattr(agent, 'tools') else [],
-                    llm_calls=1,
-                    tokens_used=0,
-                    error=error
-                )
-                self.performance_metrics.record_task(task_metrics)
-
-                # Record with health monitor
-                self.health_monitor.record_task_completion(
-                    agent.agent_id,
-                    task_duration,
-                    success
-                )
-
-                # Update resource usage
-                queue_size = len(agent.message_history) if hasattr(agent, 'message_history') else 0
-                self.health_monitor.update_resource_usage(
-                    agent.agent_id,
-                    queue_size=queue_size
-                )
+            # Independent subtasks run concurrently, level by level
+            results = await orchestrator.execute_plan(
+                plan,
+                dispatch,
+                should_stop=is_stop_requested
+            )
 
             # Step 3: Aggregate results
             if is_stop_requested():
@@ -508,6 +440,84 @@ CRITICAL: Never make up item IDs! Only use IDs returned by plex_find_unprocessed
             traceback.print_exc()
             raise
 
+    async def _dispatch_a2a_subtask(
+            self,
+            subtask: Dict[str, Any],
+            results: Dict[str, Any],
+            user_request: str
+    ) -> Any:
+        """Execute one plan subtask with its A2A agent, recording health and metrics"""
+        task_id = subtask["id"]
+        agent_role = subtask["agent"]
+        description = subtask["description"]
+        depends_on = subtask.get("depends_on", [])
+
+        # Build context from dependencies
+        context = {"user_request": user_request}
+        for dep_id in depends_on:
+            if dep_id in results:
+                context[f"result_{dep_id}"] = results[dep_id]
+
+        agent = self.a2a_agents.get(agent_role)
+        if not agent:
+            self.logger.warning("⚠️ Agent %s not found", agent_role)
+            return f"Agent {agent_role} not available"
+
+        # Execute task with tracking
+        self.logger.info("▶️  Executing %s with %s", task_id, agent_role)
+        task_start = time.time()
+
+        try:
+            result = await agent.execute_task(description, context)
+            success = True
+            error = None
+            self.logger.info("✅ %s completed", task_id)
+
+        except Exception as e:
+            result = f"Error: {str(e)}"
+            success = False
+            error = str(e)
+            self.logger.error("❌ %s failed: %s", task_id, e)
+
+            # Record error with health monitor
+            self.health_monitor.record_error(agent.agent_id, error)
+
+        task_end = time.time()
+        task_duration = task_end - task_start
+
+        # Record performance metrics
+        from client.performance_metrics import TaskMetrics
+        task_metrics = TaskMetrics(
+            task_id=task_id,
+            agent_id=agent.agent_id,
+            task_type=agent_role,
+            start_time=task_start,
+            end_time=task_end,
+            duration=task_duration,
+            success=success,
+            tools_used=list(agent.tools.keys()) if hasattr(agent, 'tools') else [],
+            llm_calls=1,
+            tokens_used=0,
+            error=error
+        )
+        self.performance_metrics.record_task(task_metrics)
+
+        # Record with health monitor
+        self.health_monitor.record_task_completion(
+            agent.agent_id,
+            task_duration,
+            success
+        )
+
+        # Update resource usage
+        queue_size = len(agent.message_history) if hasattr(agent, 'message_history') else 0
+        self.health_monitor.update_resource_usage(
+            agent.agent_id,
+            queue_size=queue_size
+        )
+
+        return result
+
     async def _a2a_single_agent(self, user_request: str) -> str:
         """Execute simple task with single A2A agent"""
         request_lower = user_request.lower()
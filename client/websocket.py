@@ -22,25 +22,73 @@ try:
 except ImportError:
     SYSTEM_MONITOR_AVAILABLE = False
 
+# Resolve the metrics provider once instead of on every metrics_request
+try:
+    from client.metrics import prepare_metrics
+    METRICS_AVAILABLE = True
+except ImportError:
+    try:
+        from metrics import prepare_metrics
+        METRICS_AVAILABLE = True
+    except ImportError:
+        METRICS_AVAILABLE = False
+
+# Sent when no metrics module is available
+_EMPTY_METRICS = {
+    "agent": {"runs": 0, "errors": 0, "error_rate": 0, "avg_time": 0, "times": []},
+    "llm": {"calls": 0, "errors": 0, "avg_time": 0, "times": []},
+    "tools": {"total_calls": 0, "total_errors": 0, "per_tool": {}},
+    "overall_errors": 0
+}
+
 CONNECTED_WEBSOCKETS = set()
 SYSTEM_MONITOR_CLIENTS = set()
 
+# Strong references to in-flight fire-and-forget broadcasts; each task
+# removes itself when done, so the set only ever holds what is still sending
+_PENDING_BROADCASTS = set()
+
+
+async def _send_to_all(message):
+    """Send an already-encoded message to all connected WebSocket clients"""
+    await asyncio.gather(
+        *[ws.send(message) for ws in CONNECTED_WEBSOCKETS],
+        return_exceptions=True
+    )
+
+
+def _encode_text_message(message_type, text):
+    """JSON for {"type": ..., "text": ...} without building the dict (same output as json.dumps)"""
+    return f'{{"type": {json.dumps(message_type)}, "text": {json.dumps(text)}}}'
+
 
 async def broadcast_message(message_type, data):
     """Broadcast a message to all connected WebSocket clients"""
     if CONNECTED_WEBSOCKETS:
-        message = json.dumps({"type": message_type, **data})
-        await asyncio.gather(
-            *[ws.send(message) for ws in CONNECTED_WEBSOCKETS],
-            return_exceptions=True
-        )
+        await _send_to_all(json.dumps({"type": message_type, **data}))
+
+
+async def broadcast_text(message_type, text):
+    """Broadcast a plain text message to all connected WebSocket clients"""
+    if CONNECTED_WEBSOCKETS:
+        await _send_to_all(_encode_text_message(message_type, text))
+
+
+def fire_broadcast(message_type, text):
+    """Schedule a plain text broadcast without waiting on the WebSocket fan-out"""
+    if not CONNECTED_WEBSOCKETS:
+        return None
+    task = asyncio.create_task(_send_to_all(_encode_text_message(message_type, text)))
+    _PENDING_BROADCASTS.add(task)
+    task.add_done_callback(_PENDING_BROADCASTS.discard)
+    return task
 
 
 async def process_query(websocket, prompt, original_prompt, agent_ref, conversation_state, run_agent_fn, logger, tools, session_manager=None, session_id=None):
     """Process a query in the background"""
     try:
         print(f"\n> {original_prompt}")
-        await broadcast_message("user_message", {"text": original_prompt})
+        fire_broadcast("user_message", original_prompt)
 
         # SESSION-BASED CONTEXT INJECTION
         if session_manager and session_id:
@@ -96,7 +144,8 @@ async def process_query(websocket, prompt, original_prompt, agent_ref, conversat
 
 async def websocket_handler(websocket, agent_ref, tools, logger, conversation_state, run_agent_fn,
                             models_module, model_name, system_prompt, orchestrator=None,
-                            multi_agent_state=None, a2a_state=None, mcp_agent=None, session_manager=None):
+                            multi_agent_state=None, a2a_state=None, mcp_agent=None, session_manager=None,
+                            tools_index=None):
     """
     Handle WebSocket connections with TRUE concurrent processing
 
@@ -263,20 +312,7 @@ async def websocket_handler(websocket, agent_ref, tools, logger, conversation_st
                 continue
 
             if data.get("type") == "metrics_request":
-                try:
-                    from client.metrics import prepare_metrics
-                    metrics_data = prepare_metrics()
-                except ImportError:
-                    try:
-                        from metrics import prepare_metrics
-                        metrics_data = prepare_metrics()
-                    except ImportError:
-                        metrics_data = {
-                            "agent": {"runs": 0, "errors": 0, "error_rate": 0, "avg_time": 0, "times": []},
-                            "llm": {"calls": 0, "errors": 0, "avg_time": 0, "times": []},
-                            "tools": {"total_calls": 0, "total_errors": 0, "per_tool": {}},
-                            "overall_errors": 0
-                        }
+                metrics_data = prepare_metrics() if METRICS_AVAILABLE else _EMPTY_METRICS
                 await websocket.send(json.dumps({
                     "type": "metrics_response",
                     "metrics": metrics_data
@@ -339,9 +375,9 @@ async def websocket_handler(websocket, agent_ref, tools, logger, conversation_st
 
                 # Handle :a2a commands (fast - process inline)
                 if prompt.startswith(":a2a"):
-                    result = await handle_a2a_commands(prompt, orchestrator)
-                    if result:
-                        await broadcast_message("assistant_message", {"text": result})
+                    handled, response, _, _ = await handle_a2a_commands(prompt, orchestrator)
+                    if handled:
+                        await broadcast_text("assistant_message", response)
                         await websocket.send(json.dumps({
                             "type": "complete",
                             "stopped": False
@@ -351,9 +387,9 @@ async def websocket_handler(websocket, agent_ref, tools, logger, conversation_st
                 # Handle :multi commands (fast - process inline)
                 if prompt.startswith(":multi"):
                     from client.commands import handle_multi_agent_commands
-                    result = await handle_multi_agent_commands(prompt, orchestrator, multi_agent_state)
-                    if result:
-                        await broadcast_message("assistant_message", {"text": result})
+                    handled, response, _, _ = handle_multi_agent_commands(prompt, orchestrator, multi_agent_state)
+                    if handled:
+                        await broadcast_text("assistant_message", response)
                         await websocket.send(json.dumps({
                             "type": "complete",
                             "stopped": False
@@ -370,11 +406,12 @@ async def websocket_handler(websocket, agent_ref, tools, logger, conversation_st
                         orchestrator=orchestrator,
                         multi_agent_state=multi_agent_state,
                         a2a_state=a2a_state,
-                        mcp_agent=mcp_agent
+                        mcp_agent=mcp_agent,
+                        tools_index=tools_index
                     )
                     if handled:
                         if response:
-                            await broadcast_message("assistant_message", {"text": response})
+                            await broadcast_text("assistant_message", response)
                         if new_agent:
                             agent_ref[0] = new_agent
                         if new_model:
@@ -449,7 +486,8 @@ async def websocket_handler(websocket, agent_ref, tools, logger, conversation_st
 
 async def start_websocket_server(agent, tools, logger, conversation_state, run_agent_fn, models_module,
                                  model_name, system_prompt, orchestrator=None, multi_agent_state=None,
-                                 a2a_state=None, mcp_agent=None, session_manager=None, host="0.0.0.0", port=8765):
+                                 a2a_state=None, mcp_agent=None, session_manager=None, host="0.0.0.0", port=8765,
+                                 tools_index=None):
     """Start the WebSocket server for chat (WITH MULTI-AGENT STATE + A2A + SESSIONS)"""
 
     async def handler(websocket):
@@ -461,7 +499,8 @@ async def start_websocket_server(agent, tools, logger, conversation_state, run_a
                 multi_agent_state=multi_agent_state,
                 a2a_state=a2a_state,
                 mcp_agent=mcp_agent,
-                session_manager=session_manager
+                session_manager=session_manager,
+                tools_index=tools_index
             )
         except websockets.exceptions.ConnectionClosed:
             pass
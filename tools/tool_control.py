@@ -35,7 +35,7 @@ Or use decorator:
 import os
 import json
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
@@ -84,10 +84,14 @@ def _parse_disabled_tools():
 _parse_disabled_tools()
 
 
+@lru_cache(maxsize=1024)
 def is_tool_enabled(tool_name: str, category: Optional[str] = None) -> bool:
     """
     Check if a tool is enabled.
 
+    DISABLED_TOOLS is parsed once at import, so answers are cached; call
+    is_tool_enabled.cache_clear() if the disabled sets are ever reloaded.
+
     Args:
         tool_name: Name of the tool to check
         category: Optional category (e.g., "todo", "system")